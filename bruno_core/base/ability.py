@@ -5,10 +5,15 @@ Provides a base class for all abilities with common functionality.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from bruno_core.interfaces.ability import AbilityInterface
-from bruno_core.models.ability import AbilityMetadata, AbilityRequest, AbilityResponse
+from bruno_core.models.ability import (
+    AbilityMetadata,
+    AbilityParameter,
+    AbilityRequest,
+    AbilityResponse,
+)
 from bruno_core.utils.exceptions import AbilityError
 from bruno_core.utils.logging import get_logger
 
@@ -36,6 +41,9 @@ class BaseAbility(AbilityInterface):
         """Initialize base ability."""
         self.initialized = False
         self._metadata: AbilityMetadata = self.get_metadata()
+        # Validation data derived on first use (see refresh_metadata)
+        self._supported_actions: Optional[FrozenSet[str]] = None
+        self._required_parameters: Optional[List[AbilityParameter]] = None
         logger.info("ability_created", name=self._metadata.name)
 
     async def execute(self, request: AbilityRequest) -> AbilityResponse:
@@ -67,7 +75,7 @@ class BaseAbility(AbilityInterface):
                     error="Invalid request parameters",
                 )
 
-            logger.info(
+            logger.debug(
                 "ability_executing",
                 ability=self._metadata.name,
                 action=request.action,
@@ -76,7 +84,7 @@ class BaseAbility(AbilityInterface):
             # Execute the actual action
             response = await self.execute_action(request)
 
-            logger.info(
+            logger.debug(
                 "ability_executed",
                 ability=self._metadata.name,
                 success=response.success,
@@ -138,7 +146,7 @@ class BaseAbility(AbilityInterface):
         if request.ability_name != self._metadata.name:
             return False
 
-        if request.action not in self.get_supported_actions():
+        if request.action not in self._get_supported_action_set():
             return False
 
         return True
@@ -153,7 +161,6 @@ class BaseAbility(AbilityInterface):
             logger.warning("ability_already_initialized", name=self._metadata.name)
             return
 
-        logger.info("ability_initializing", name=self._metadata.name)
         self.initialized = True
         logger.info("ability_initialized", name=self._metadata.name)
 
@@ -163,7 +170,6 @@ class BaseAbility(AbilityInterface):
 
         Override this method to add custom cleanup logic.
         """
-        logger.info("ability_shutting_down", name=self._metadata.name)
         self.initialized = False
         logger.info("ability_shutdown_complete", name=self._metadata.name)
 
@@ -192,6 +198,24 @@ class BaseAbility(AbilityInterface):
         """
         return []
 
+    def refresh_metadata(self) -> None:
+        """
+        Reload metadata and supported actions.
+
+        Supported actions and required parameters are read once and reused
+        for every request. Call this after changing either at runtime.
+        """
+        self._metadata = self.get_metadata()
+        self._supported_actions = None
+        self._required_parameters = None
+        logger.debug("ability_metadata_refreshed", name=self._metadata.name)
+
+    def _get_supported_action_set(self) -> FrozenSet[str]:
+        """Return supported actions as a set, computing it on first use."""
+        if self._supported_actions is None:
+            self._supported_actions = frozenset(self.get_supported_actions())
+        return self._supported_actions
+
     def validate_request(self, request: AbilityRequest) -> bool:
         """
         Validate an ability request.
@@ -206,7 +230,7 @@ class BaseAbility(AbilityInterface):
         """
         try:
             # Check if action is supported
-            if request.action not in self.get_supported_actions():
+            if request.action not in self._get_supported_action_set():
                 logger.warning(
                     "unsupported_action",
                     ability=self._metadata.name,
@@ -215,8 +239,9 @@ class BaseAbility(AbilityInterface):
                 return False
 
             # Validate required parameters
-            required_params = self._metadata.get_required_parameters()
-            for param in required_params:
+            if self._required_parameters is None:
+                self._required_parameters = self._metadata.get_required_parameters()
+            for param in self._required_parameters:
                 if param.name not in request.parameters:
                     logger.warning(
                         "missing_required_parameter",
@@ -5,7 +5,9 @@ Provides a default implementation of AssistantInterface that coordinates
 LLM, memory, abilities, and other components.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple, cast
 
 from bruno_core.interfaces.ability import AbilityInterface
 from bruno_core.interfaces.assistant import AssistantInterface
@@ -15,6 +17,7 @@ from bruno_core.models.ability import AbilityRequest, AbilityResponse
 from bruno_core.models.context import ConversationContext
 from bruno_core.models.message import Message, MessageRole
 from bruno_core.models.response import ActionResult, ActionStatus, AssistantResponse
+from bruno_core.utils.async_utils import cancel_tasks
 from bruno_core.utils.exceptions import BrunoError, RegistryError
 from bruno_core.utils.logging import get_logger
 
@@ -62,6 +65,13 @@ class BaseAssistant(AssistantInterface):
         self.abilities: Dict[str, AbilityInterface] = {}
         self.initialized = False
 
+        # Compiled matcher for ability names, rebuilt when the set of
+        # abilities changes (see _get_ability_matcher)
+        self._matcher_names: Tuple[str, ...] = ()
+        self._ability_pattern: Optional[Pattern[str]] = None
+        self._shadowed_abilities: List[str] = []
+        self._ability_keywords: List[Tuple[str, str]] = []
+
         logger.info("base_assistant_created", llm=llm.__class__.__name__)
 
     async def process_message(
@@ -109,14 +119,26 @@ class BaseAssistant(AssistantInterface):
             # Add user message to context
             context.add_message(message)
 
-            # Store message in memory
-            await self.memory.store_message(message, context.conversation_id)
-
             # Check for ability requests
             ability_actions = await self._detect_abilities(message, context)
 
-            # Generate LLM response
-            llm_response = await self._generate_response(context)
+            # Store the user message while the LLM generates the response.
+            # A failed store cancels generation; a failed or cancelled
+            # generation still lets the store finish, so the user message
+            # is always kept. The shield stops a cancelled turn from
+            # cancelling the store through gather
+            store_task = asyncio.ensure_future(
+                self.memory.store_message(message, context.conversation_id)
+            )
+            generate_task = asyncio.ensure_future(self._generate_response(context))
+            try:
+                _, llm_response = await asyncio.gather(asyncio.shield(store_task), generate_task)
+            except BaseException:
+                if store_task.done() and not store_task.cancelled() and store_task.exception():
+                    await cancel_tasks(generate_task)
+                else:
+                    await asyncio.gather(store_task, return_exceptions=True)
+                raise
 
             # Create assistant message
             assistant_message = Message(
@@ -129,8 +151,9 @@ class BaseAssistant(AssistantInterface):
             context.add_message(assistant_message)
             await self.memory.store_message(assistant_message, context.conversation_id)
 
-            # Execute abilities if detected
-            action_results = []
+            # Execute abilities only once the turn has succeeded, so a
+            # failed turn never triggers their side effects
+            action_results: List[ActionResult] = []
             if ability_actions:
                 action_results = await self._execute_abilities(ability_actions)
 
@@ -229,7 +252,10 @@ class BaseAssistant(AssistantInterface):
             if not await self.llm.check_connection():
                 raise BrunoError("LLM connection failed")
 
-            # Additional initialization can be added here
+            # Build the ability matcher now so the first message does not pay
+            # for compiling it
+            self._get_ability_matcher()
+
             self.initialized = True
             logger.info("assistant_initialized")
 
@@ -239,18 +265,31 @@ class BaseAssistant(AssistantInterface):
     async def shutdown(self) -> None:
         """
         Gracefully shutdown the assistant and cleanup resources.
+
+        Safe to call more than once, including concurrently: abilities are
+        detached before any of them is shut down, so each is shut down once.
         """
-        logger.info("shutting_down_assistant")
+        if not self.initialized and not self.abilities:
+            logger.debug("assistant_already_shut_down")
+            return
 
-        # Shutdown all abilities
-        for ability_name, ability in list(self.abilities.items()):
-            try:
-                await ability.shutdown()
-            except Exception as e:
-                logger.error("ability_shutdown_failed", name=ability_name, error=str(e))
+        logger.info("shutting_down_assistant")
 
+        # Detach abilities first so a second shutdown() call finds nothing left
+        abilities = list(self.abilities.items())
         self.abilities.clear()
         self.initialized = False
+
+        # Shutdown all abilities concurrently; they are independent, so
+        # teardown takes as long as the slowest one
+        results = await asyncio.gather(
+            *(ability.shutdown() for _, ability in abilities),
+            return_exceptions=True,
+        )
+        for (ability_name, _), result in zip(abilities, results):
+            if isinstance(result, Exception):
+                logger.error("ability_shutdown_failed", name=ability_name, error=str(result))
+
         logger.info("assistant_shutdown_complete")
 
     async def health_check(self) -> Dict[str, Any]:
@@ -268,25 +307,32 @@ class BaseAssistant(AssistantInterface):
             "memory": "unknown",
         }
 
+        # Check the LLM and every ability concurrently; they are independent,
+        # so the check takes as long as the slowest component
+        abilities = list(self.abilities.items())
+        llm_result, *ability_results = await asyncio.gather(
+            self.llm.check_connection(),
+            *(ability.health_check() for _, ability in abilities),
+            return_exceptions=True,
+        )
+
         # Check LLM
-        try:
-            if await self.llm.check_connection():
-                health["llm"] = "connected"
-            else:
-                health["llm"] = "disconnected"
-                health["status"] = "degraded"
-        except Exception:
+        if isinstance(llm_result, Exception):
             health["llm"] = "error"
             health["status"] = "unhealthy"
+        elif llm_result:
+            health["llm"] = "connected"
+        else:
+            health["llm"] = "disconnected"
+            health["status"] = "degraded"
 
         # Check abilities
         abilities_health: Dict[str, Any] = {}
-        for name, ability in self.abilities.items():
-            try:
-                ability_health = await ability.health_check()
+        for (name, _), ability_health in zip(abilities, ability_results):
+            if isinstance(ability_health, Exception):
+                abilities_health[name] = {"status": "error", "error": str(ability_health)}
+            else:
                 abilities_health[name] = ability_health
-            except Exception as e:
-                abilities_health[name] = {"status": "error", "error": str(e)}
         health["abilities"] = abilities_health
 
         return health
@@ -361,14 +407,27 @@ class BaseAssistant(AssistantInterface):
         """
         # Simple keyword-based detection for now
         # In a full implementation, this would use LLM to detect intents
-        requests = []
+        requests: List[AbilityRequest] = []
+
+        pattern = self._get_ability_matcher()
+        if pattern is None:
+            return requests
+
+        # casefold() also folds non-ASCII case pairs (e.g. "ß" and "ss")
+        content_folded = message.content.casefold()
 
-        content_lower = message.content.lower()
+        # One pass over the message finds every mentioned ability name
+        found = {match.group(1) for match in pattern.finditer(content_folded)}
+        if not found:
+            return requests
 
-        # Check each registered ability
-        for ability_name, ability in self.abilities.items():
-            # This is a simple check - real implementation would be more sophisticated
-            if ability_name in content_lower:
+        # A name that is a prefix of a longer name can be hidden by it at the
+        # same position; check those few directly
+        found.update(name for name in self._shadowed_abilities if name in content_folded)
+
+        # Keep registration order
+        for ability_name, keyword in self._ability_keywords:
+            if keyword in found:
                 request = AbilityRequest(
                     ability_name=ability_name,
                     action="execute",
@@ -380,65 +439,120 @@ class BaseAssistant(AssistantInterface):
 
         return requests
 
+    def _get_ability_matcher(self) -> Optional[Pattern[str]]:
+        """
+        Get the compiled pattern matching registered ability names.
+
+        Names are case-folded once here rather than on every message, so
+        matching against the case-folded message content is case-insensitive.
+
+        The matcher is only rebuilt when the names in ``abilities`` change,
+        including direct changes to the dict, so the per-message check is a
+        tuple comparison.
+
+        Returns:
+            Compiled pattern, or None if no abilities are registered
+        """
+        names = tuple(self.abilities)
+        if names != self._matcher_names:
+            self._matcher_names = names
+            self._ability_keywords = [(name, name.casefold()) for name in names]
+            if names:
+                keywords = {keyword for _, keyword in self._ability_keywords}
+                # Longest first, inside a lookahead so overlapping mentions
+                # are all reported
+                ordered = sorted(keywords, key=len, reverse=True)
+                alternation = "|".join(re.escape(keyword) for keyword in ordered)
+                self._ability_pattern = re.compile(f"(?=({alternation}))")
+                self._shadowed_abilities = [
+                    keyword
+                    for keyword in keywords
+                    if any(other != keyword and other.startswith(keyword) for other in keywords)
+                ]
+            else:
+                self._ability_pattern = None
+                self._shadowed_abilities = []
+
+        return self._ability_pattern
+
     async def _execute_abilities(self, requests: List[AbilityRequest]) -> List[ActionResult]:
         """
         Execute ability requests.
 
+        Requests for different abilities run concurrently; requests for the
+        same ability run one after another in their original order.
+
         Args:
             requests: List of ability requests
 
         Returns:
-            List of action results
+            List of action results, in request order
         """
-        results = []
+        if len(requests) == 1:
+            return [await self._execute_ability(requests[0])]
 
-        for request in requests:
-            try:
-                ability = self.abilities.get(request.ability_name)
-                if not ability:
-                    results.append(
-                        ActionResult(
-                            action_type=request.ability_name,
-                            status=ActionStatus.FAILED,
-                            error=f"Ability not found: {request.ability_name}",
-                        )
-                    )
-                    continue
-
-                if not ability.can_handle(request):
-                    results.append(
-                        ActionResult(
-                            action_type=request.ability_name,
-                            status=ActionStatus.SKIPPED,
-                            message="Ability cannot handle this request",
-                        )
-                    )
-                    continue
-
-                response: AbilityResponse = await ability.execute(request)
-
-                results.append(
-                    ActionResult(
-                        action_type=request.ability_name,
-                        status=(ActionStatus.SUCCESS if response.success else ActionStatus.FAILED),
-                        message=response.message,
-                        data=response.data,
-                        error=response.error,
-                    )
-                )
+        # Group request positions by ability so each ability sees its
+        # requests in order
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            groups.setdefault(request.ability_name, []).append(index)
+
+        results: List[Optional[ActionResult]] = [None] * len(requests)
+
+        async def run_group(indices: List[int]) -> None:
+            for index in indices:
+                results[index] = await self._execute_ability(requests[index])
+
+        await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+
+        # _execute_ability reports failures as results, so every slot is
+        # filled once the groups finish; no need to filter the list again
+        return cast(List[ActionResult], results)
+
+    async def _execute_ability(self, request: AbilityRequest) -> ActionResult:
+        """
+        Execute a single ability request.
 
-            except Exception as e:
-                logger.error(
-                    "ability_execution_failed",
-                    ability=request.ability_name,
-                    error=str(e),
+        Args:
+            request: Ability request
+
+        Returns:
+            Action result (failures are reported, not raised)
+        """
+        try:
+            ability = self.abilities.get(request.ability_name)
+            if not ability:
+                return ActionResult(
+                    action_type=request.ability_name,
+                    status=ActionStatus.FAILED,
+                    error=f"Ability not found: {request.ability_name}",
                 )
-                results.append(
-                    ActionResult(
-                        action_type=request.ability_name,
-                        status=ActionStatus.FAILED,
-                        error=str(e),
-                    )
+
+            if not ability.can_handle(request):
+                return ActionResult(
+                    action_type=request.ability_name,
+                    status=ActionStatus.SKIPPED,
+                    message="Ability cannot handle this request",
                 )
 
-        return results
+            response: AbilityResponse = await ability.execute(request)
+
+            return ActionResult(
+                action_type=request.ability_name,
+                status=(ActionStatus.SUCCESS if response.success else ActionStatus.FAILED),
+                message=response.message,
+                data=response.data,
+                error=response.error,
+            )
+
+        except Exception as e:
+            logger.error(
+                "ability_execution_failed",
+                ability=request.ability_name,
+                error=str(e),
+            )
+            return ActionResult(
+                action_type=request.ability_name,
+                status=ActionStatus.FAILED,
+                error=str(e),
+            )
@@ -27,6 +27,9 @@ class ChainStep:
         on_failure: Optional callback on failure
     """
 
+    # Steps are created per chain build; slots keep them small and fast to access
+    __slots__ = ("ability_name", "action", "parameters", "condition", "on_success", "on_failure")
+
     def __init__(
         self,
         ability_name: str,
@@ -115,7 +118,7 @@ class ChainExecutor:
             on_failure=on_failure,
         )
         self.steps.append(step)
-        logger.info("chain_step_added", ability=ability_name, action=action)
+        logger.debug("chain_step_added", ability=ability_name, action=action)
         return self
 
     async def execute(
@@ -155,7 +158,7 @@ class ChainExecutor:
         responses: List[AbilityResponse] = []
 
         for i, step in enumerate(self.steps):
-            logger.info(
+            logger.debug(
                 "executing_chain_step",
                 step=i + 1,
                 ability=step.ability_name,
@@ -164,7 +167,7 @@ class ChainExecutor:
 
             # Check condition
             if step.condition and not step.condition(self.context):
-                logger.info(
+                logger.debug(
                     "step_skipped_by_condition",
                     step=i + 1,
                     ability=step.ability_name,
@@ -39,13 +39,18 @@ class ActionExecutor:
         Initialize action executor.
 
         Args:
-            max_concurrent: Maximum concurrent actions
+            max_concurrent: Maximum concurrent actions (0 disables the limit)
             enable_rollback: Enable automatic rollback on failure
         """
         self.max_concurrent = max_concurrent
         self.enable_rollback = enable_rollback
         self.execution_history: List[Dict[str, Any]] = []
 
+        # Running totals over execution_history, so statistics need no scan
+        self._total_actions = 0
+        self._total_successful = 0
+        self._total_failed = 0
+
         logger.info("action_executor_initialized", max_concurrent=max_concurrent)
 
     async def execute(
@@ -70,16 +75,17 @@ class ActionExecutor:
 
         logger.info("executing_actions", count=len(actions), parallel=parallel)
 
-        if parallel:
+        # A single action has nothing to overlap with; run it inline
+        if parallel and len(actions) > 1:
             results = await self._execute_parallel(actions, ability_map)
         else:
             results = await self._execute_sequential(actions, ability_map)
 
         # Log execution
-        self._log_execution(actions, results)
+        execution_record = self._log_execution(actions, results)
 
         # Check for failures and rollback if enabled
-        if self.enable_rollback and any(r.status == ActionStatus.FAILED for r in results):
+        if self.enable_rollback and execution_record["failed"]:
             await self._rollback(actions, results, ability_map)
 
         return results
@@ -108,13 +114,13 @@ class ActionExecutor:
         ability_map: Dict[str, Any],
     ) -> List[ActionResult]:
         """Execute actions in parallel with concurrency limit."""
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        async def execute_with_semaphore(action: AbilityRequest) -> ActionResult:
-            async with semaphore:
-                return await self._execute_single(action, ability_map)
+        # The limit can only be hit when there are more actions than slots
+        semaphore: Optional[asyncio.Semaphore] = None
+        if self.max_concurrent > 0 and len(actions) > self.max_concurrent:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
 
-        tasks = [execute_with_semaphore(action) for action in actions]
+        # The semaphore only guards the ability call itself (see _execute_single)
+        tasks = [self._execute_single(action, ability_map, semaphore) for action in actions]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Convert exceptions to failed results
@@ -137,8 +143,16 @@ class ActionExecutor:
         self,
         action: AbilityRequest,
         ability_map: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> ActionResult:
-        """Execute a single action."""
+        """
+        Execute a single action.
+
+        Args:
+            action: Ability request to execute
+            ability_map: Map of ability name to ability instance
+            semaphore: Optional concurrency limit, held only while the ability runs
+        """
         try:
             ability = ability_map.get(action.ability_name)
             if not ability:
@@ -148,9 +162,13 @@ class ActionExecutor:
                     error=f"Ability not found: {action.ability_name}",
                 )
 
-            logger.info("executing_action", ability=action.ability_name, action=action.action)
+            logger.debug("executing_action", ability=action.ability_name, action=action.action)
 
-            response: AbilityResponse = await ability.execute(action)
+            if semaphore is None:
+                response: AbilityResponse = await ability.execute(action)
+            else:
+                async with semaphore:
+                    response = await ability.execute(action)
 
             return ActionResult(
                 action_type=action.ability_name,
@@ -188,11 +206,12 @@ class ActionExecutor:
         """
         logger.warning("rolling_back_actions")
 
-        # Find successfully executed actions
-        successful_indices = [i for i, r in enumerate(results) if r.status == ActionStatus.SUCCESS]
+        # Rollback successfully executed actions in reverse order, walking
+        # the results once from the end
+        for i in range(len(results) - 1, -1, -1):
+            if results[i].status != ActionStatus.SUCCESS:
+                continue
 
-        # Rollback in reverse order
-        for i in reversed(successful_indices):
             action = actions[i]
             ability = ability_map.get(action.ability_name)
 
@@ -211,17 +230,31 @@ class ActionExecutor:
         self,
         actions: List[AbilityRequest],
         results: List[ActionResult],
-    ) -> None:
-        """Log execution to history."""
+    ) -> Dict[str, Any]:
+        """
+        Log execution to history.
+
+        Returns:
+            The execution record (action count and per-status counts)
+        """
+        # Count every status in a single pass over the results
+        counts = dict.fromkeys(ActionStatus, 0)
+        for result in results:
+            counts[result.status] += 1
+
         execution_record = {
             "actions_count": len(actions),
-            "successful": sum(1 for r in results if r.status == ActionStatus.SUCCESS),
-            "failed": sum(1 for r in results if r.status == ActionStatus.FAILED),
-            "skipped": sum(1 for r in results if r.status == ActionStatus.SKIPPED),
+            "successful": counts[ActionStatus.SUCCESS],
+            "failed": counts[ActionStatus.FAILED],
+            "skipped": counts[ActionStatus.SKIPPED],
         }
 
         self.execution_history.append(execution_record)
+        self._total_actions += execution_record["actions_count"]
+        self._total_successful += execution_record["successful"]
+        self._total_failed += execution_record["failed"]
         logger.info("actions_executed", **execution_record)
+        return execution_record
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -233,18 +266,20 @@ class ActionExecutor:
         if not self.execution_history:
             return {"total_executions": 0}
 
-        total_actions = sum(e["actions_count"] for e in self.execution_history)
-        total_successful = sum(e["successful"] for e in self.execution_history)
-        total_failed = sum(e["failed"] for e in self.execution_history)
+        total_actions = self._total_actions
+        total_successful = self._total_successful
 
         return {
             "total_executions": len(self.execution_history),
             "total_actions": total_actions,
             "successful": total_successful,
-            "failed": total_failed,
+            "failed": self._total_failed,
             "success_rate": (total_successful / total_actions if total_actions > 0 else 0),
         }
 
     def clear_history(self) -> None:
         """Clear execution history."""
         self.execution_history.clear()
+        self._total_actions = 0
+        self._total_successful = 0
+        self._total_failed = 0
@@ -4,11 +4,14 @@ Context Manager implementation.
 Manages conversation context windows with rolling message buffers.
 """
 
+import asyncio
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
 
 from bruno_core.interfaces.memory import MemoryInterface
-from bruno_core.models.context import ConversationContext
+from bruno_core.models.context import ConversationContext, SessionContext, UserContext
 from bruno_core.models.message import Message, MessageRole
 from bruno_core.utils.exceptions import ContextError
 from bruno_core.utils.logging import get_logger
@@ -16,6 +19,16 @@ from bruno_core.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+class _ConversationWindow:
+    """Rolling message window and running message count for one conversation."""
+
+    __slots__ = ("messages", "total")
+
+    def __init__(self, max_messages: int) -> None:
+        self.messages: Deque[Message] = deque(maxlen=max_messages)
+        self.total = 0
+
+
 class ContextManager:
     """
     Manages conversation context with rolling window and memory integration.
@@ -39,24 +52,45 @@ class ContextManager:
         max_messages: int = 20,
         compression_threshold: int = 50,
         auto_save: bool = True,
+        background_save: bool = False,
     ):
         """
         Initialize context manager.
 
         Args:
             memory: Memory backend for persistence
-            max_messages: Maximum messages in rolling window
+            max_messages: Maximum messages in rolling window. Changing it
+                later resizes a conversation's window the next time a
+                message is added to it
             compression_threshold: Message count triggering compression
             auto_save: Automatically save messages to memory
+            background_save: Save messages in background tasks so adding a
+                message does not wait on the memory backend. Saves for a
+                conversation still happen in order; failures are logged
+                rather than raised. Call flush() to wait for them.
         """
         self.memory = memory
+        # retrieve_context is an optional extension method; resolve it once
+        self._retrieve_context: Optional[Callable[..., Any]] = getattr(
+            memory, "retrieve_context", None
+        )
         self.max_messages = max_messages
         self.compression_threshold = compression_threshold
         self.auto_save = auto_save
+        self.background_save = background_save
+
+        # Background saves still running, and the newest one per
+        # conversation (each save waits for its predecessor to keep order)
+        self._pending_saves: Set["asyncio.Task[None]"] = set()
+        self._save_tails: Dict[str, "asyncio.Task[None]"] = {}
 
-        # Context buffers per conversation
-        self._buffers: Dict[str, List[Message]] = {}
-        self._message_counts: Dict[str, int] = {}
+        # Message window and message count per conversation, kept in one
+        # record so each message costs a single lookup
+        self._conversations: Dict[str, _ConversationWindow] = {}
+
+        # Running totals across all conversations (avoid scanning for stats)
+        self._total_buffered = 0
+        self._total_processed = 0
 
         logger.info(
             "context_manager_initialized",
@@ -79,18 +113,21 @@ class ContextManager:
             user_id: Optional user identifier for memory storage
         """
         try:
-            # Initialize buffer if needed
-            if conversation_id not in self._buffers:
-                self._buffers[conversation_id] = []
-                self._message_counts[conversation_id] = 0
+            window = self._get_window(conversation_id)
+            buffer = window.messages
+
+            # Apply rolling window: a full buffer drops its oldest message
+            # when the new one is appended
+            previous_size = len(buffer)
+            removed = buffer[0] if buffer and previous_size == buffer.maxlen else None
 
             # Add to buffer
-            self._buffers[conversation_id].append(message)
-            self._message_counts[conversation_id] += 1
+            buffer.append(message)
+            self._total_buffered += len(buffer) - previous_size
+            window.total += 1
+            self._total_processed += 1
 
-            # Apply rolling window
-            if len(self._buffers[conversation_id]) > self.max_messages:
-                removed = self._buffers[conversation_id].pop(0)
+            if removed is not None:
                 logger.debug(
                     "message_removed_from_window",
                     conversation_id=conversation_id,
@@ -99,14 +136,17 @@ class ContextManager:
 
             # Save to memory if enabled
             if self.auto_save and user_id:
-                await self.memory.store_message(message, conversation_id)
+                if self.background_save:
+                    self._schedule_save([message], conversation_id)
+                else:
+                    await self.memory.store_message(message, conversation_id)
 
             # Check compression trigger
             if self._should_trigger_compression(conversation_id):
                 logger.info(
                     "compression_threshold_reached",
                     conversation_id=conversation_id,
-                    message_count=self._message_counts[conversation_id],
+                    message_count=window.total,
                 )
                 # Note: Actual compression would be handled by a background job
                 # This just logs the trigger point
@@ -115,7 +155,7 @@ class ContextManager:
                 "message_added_to_context",
                 conversation_id=conversation_id,
                 role=message.role,
-                buffer_size=len(self._buffers[conversation_id]),
+                buffer_size=len(buffer),
             )
 
         except Exception as e:
@@ -130,6 +170,85 @@ class ContextManager:
                 cause=e,
             )
 
+    async def add_messages(
+        self,
+        messages: List[Message],
+        conversation_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """
+        Add several messages to the conversation context at once.
+
+        Equivalent to calling add_message() for each message in order, but
+        the window and counters are updated once for the whole batch.
+
+        Args:
+            messages: Messages to add, oldest first
+            conversation_id: Conversation identifier
+            user_id: Optional user identifier for memory storage
+        """
+        if not messages:
+            return
+
+        try:
+            window = self._get_window(conversation_id)
+            buffer = window.messages
+
+            previous_total = window.total
+            previous_size = len(buffer)
+            buffer.extend(messages)
+            removed = previous_size + len(messages) - len(buffer)
+
+            window.total += len(messages)
+            self._total_processed += len(messages)
+            self._total_buffered += len(buffer) - previous_size
+
+            if removed:
+                logger.debug(
+                    "messages_removed_from_window",
+                    conversation_id=conversation_id,
+                    count=removed,
+                )
+
+            # Save to memory if enabled, keeping message order
+            if self.auto_save and user_id:
+                if self.background_save:
+                    self._schedule_save(list(messages), conversation_id)
+                else:
+                    for message in messages:
+                        await self.memory.store_message(message, conversation_id)
+
+            # The batch may have crossed a compression threshold
+            if (
+                self.compression_threshold > 0
+                and window.total // self.compression_threshold
+                > previous_total // self.compression_threshold
+            ):
+                logger.info(
+                    "compression_threshold_reached",
+                    conversation_id=conversation_id,
+                    message_count=window.total,
+                )
+
+            logger.debug(
+                "messages_added_to_context",
+                conversation_id=conversation_id,
+                count=len(messages),
+                buffer_size=len(buffer),
+            )
+
+        except Exception as e:
+            logger.error(
+                "failed_to_add_message",
+                conversation_id=conversation_id,
+                error=str(e),
+            )
+            raise ContextError(
+                "Failed to add messages to context",
+                details={"conversation_id": conversation_id, "count": len(messages)},
+                cause=e,
+            )
+
     async def get_context(
         self,
         conversation_id: str,
@@ -149,31 +268,30 @@ class ContextManager:
         """
         try:
             # Get messages from buffer
-            buffer_messages = self._buffers.get(conversation_id, [])
+            window = self._conversations.get(conversation_id)
+            buffer = window.messages if window is not None else ()
 
             # Filter system messages if needed
-            if not include_system:
-                buffer_messages = [m for m in buffer_messages if m.role != MessageRole.SYSTEM]
+            if include_system:
+                buffer_messages = list(buffer)
+            else:
+                buffer_messages = [m for m in buffer if m.role != MessageRole.SYSTEM]
 
             # Retrieve relevant memories if user_id provided
             relevant_memories = []
-            if user_id and buffer_messages:
+            if user_id and buffer_messages and self._retrieve_context is not None:
                 # Get the last user message as query context
-                user_messages = [m for m in buffer_messages if m.role == MessageRole.USER]
-                if user_messages and hasattr(self.memory, "retrieve_context"):
-                    last_query = user_messages[-1].content
-                    # retrieve_context is an optional extension method
-                    relevant_memories = await self.memory.retrieve_context(
-                        user_id=user_id, query=last_query, limit=5
+                last_user = self.get_last_message(conversation_id, MessageRole.USER)
+                if last_user is not None:
+                    relevant_memories = await self._retrieve_context(
+                        user_id=user_id, query=last_user.content, limit=5
                     )
 
-            # Create user and session contexts
-            from bruno_core.models.context import SessionContext, UserContext
-
             # Ensure user_id and conversation_id are not None
             safe_user_id = user_id or "unknown"
             safe_conversation_id = conversation_id or "default"
 
+            # Create user and session contexts
             user_context = UserContext(user_id=safe_user_id)
             session_context = SessionContext(
                 user_id=safe_user_id, conversation_id=safe_conversation_id
@@ -187,7 +305,7 @@ class ContextManager:
                 messages=buffer_messages,
                 metadata={
                     "buffer_size": len(buffer_messages),
-                    "total_messages": self._message_counts.get(conversation_id, 0),
+                    "total_messages": window.total if window is not None else 0,
                     "relevant_memories_count": len(relevant_memories),
                     "timestamp": datetime.utcnow().isoformat(),
                 },
@@ -227,12 +345,11 @@ class ContextManager:
         Args:
             conversation_id: Conversation identifier
         """
-        if conversation_id in self._buffers:
-            message_count = len(self._buffers[conversation_id])
-            del self._buffers[conversation_id]
-
-            if conversation_id in self._message_counts:
-                del self._message_counts[conversation_id]
+        window = self._conversations.pop(conversation_id, None)
+        if window is not None:
+            message_count = len(window.messages)
+            self._total_buffered -= message_count
+            self._total_processed -= window.total
 
             logger.info(
                 "context_cleared",
@@ -240,6 +357,52 @@ class ContextManager:
                 messages_removed=message_count,
             )
 
+    async def flush(self) -> None:
+        """
+        Wait for background message saves to finish.
+
+        Only needed with background_save enabled, e.g. before shutdown or
+        before reading messages back from the memory backend.
+        """
+        while self._pending_saves:
+            await asyncio.gather(*self._pending_saves)
+
+    def _schedule_save(self, messages: List[Message], conversation_id: str) -> None:
+        """Store messages in a background task, after earlier saves for the conversation."""
+        previous = self._save_tails.get(conversation_id)
+        task = asyncio.create_task(self._store_after(previous, messages, conversation_id))
+        self._save_tails[conversation_id] = task
+        self._pending_saves.add(task)
+        task.add_done_callback(partial(self._save_finished, conversation_id))
+
+    async def _store_after(
+        self,
+        previous: Optional["asyncio.Task[None]"],
+        messages: List[Message],
+        conversation_id: str,
+    ) -> None:
+        """Store messages once the previous save for the conversation is done."""
+        if previous is not None:
+            # wait() does not re-raise; a failed save is already logged
+            await asyncio.wait((previous,))
+
+        try:
+            for message in messages:
+                await self.memory.store_message(message, conversation_id)
+        except Exception as e:
+            logger.error(
+                "background_save_failed",
+                conversation_id=conversation_id,
+                count=len(messages),
+                error=str(e),
+            )
+
+    def _save_finished(self, conversation_id: str, task: "asyncio.Task[None]") -> None:
+        """Forget a finished background save."""
+        self._pending_saves.discard(task)
+        if self._save_tails.get(conversation_id) is task:
+            del self._save_tails[conversation_id]
+
     def get_buffer_size(self, conversation_id: str) -> int:
         """
         Get current buffer size for a conversation.
@@ -250,7 +413,8 @@ class ContextManager:
         Returns:
             Number of messages in buffer
         """
-        return len(self._buffers.get(conversation_id, []))
+        window = self._conversations.get(conversation_id)
+        return len(window.messages) if window is not None else 0
 
     def get_total_messages(self, conversation_id: str) -> int:
         """
@@ -262,7 +426,49 @@ class ContextManager:
         Returns:
             Total messages processed
         """
-        return self._message_counts.get(conversation_id, 0)
+        window = self._conversations.get(conversation_id)
+        return window.total if window is not None else 0
+
+    def get_last_message(
+        self,
+        conversation_id: str,
+        role: MessageRole = MessageRole.ASSISTANT,
+    ) -> Optional[Message]:
+        """
+        Get the most recent buffered message with a given role.
+
+        Scans the window from the newest message without building a full
+        context, so callers that only need the last reply avoid copying
+        the buffer.
+
+        Args:
+            conversation_id: Conversation identifier
+            role: Role to look for (default: assistant)
+
+        Returns:
+            The most recent matching message, or None
+
+        Example:
+            >>> reply = manager.get_last_message("conv_123")
+            >>> question = manager.get_last_message("conv_123", MessageRole.USER)
+        """
+        window = self._conversations.get(conversation_id)
+        if window is None:
+            return None
+        return next((m for m in reversed(window.messages) if m.role == role), None)
+
+    def _get_window(self, conversation_id: str) -> _ConversationWindow:
+        """Return the window for a conversation, creating it if needed."""
+        window = self._conversations.get(conversation_id)
+        if window is None:
+            window = self._conversations[conversation_id] = _ConversationWindow(self.max_messages)
+        elif window.messages.maxlen != self.max_messages:
+            # max_messages changed since the window was created; resize it,
+            # keeping the newest messages
+            previous_size = len(window.messages)
+            window.messages = deque(window.messages, maxlen=self.max_messages)
+            self._total_buffered += len(window.messages) - previous_size
+        return window
 
     def _should_trigger_compression(self, conversation_id: str) -> bool:
         """
@@ -274,7 +480,7 @@ class ContextManager:
         Returns:
             True if compression threshold reached
         """
-        count = self._message_counts.get(conversation_id, 0)
+        count = self.get_total_messages(conversation_id)
         return count > 0 and count % self.compression_threshold == 0
 
     def list_active_conversations(self) -> List[str]:
@@ -284,7 +490,7 @@ class ContextManager:
         Returns:
             List of conversation IDs with active buffers
         """
-        return list(self._buffers.keys())
+        return list(self._conversations.keys())
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -293,13 +499,10 @@ class ContextManager:
         Returns:
             Dict with statistics
         """
-        total_buffered = sum(len(buffer) for buffer in self._buffers.values())
-        total_messages = sum(self._message_counts.values())
-
         return {
-            "active_conversations": len(self._buffers),
-            "total_buffered_messages": total_buffered,
-            "total_messages_processed": total_messages,
+            "active_conversations": len(self._conversations),
+            "total_buffered_messages": self._total_buffered,
+            "total_messages_processed": self._total_processed,
             "max_messages": self.max_messages,
             "compression_threshold": self.compression_threshold,
         }
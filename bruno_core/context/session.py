@@ -4,9 +4,11 @@ Session Manager implementation.
 Manages session lifecycle, state, and metadata.
 """
 
+import heapq
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bruno_core.models.context import SessionContext
 from bruno_core.utils.exceptions import SessionError
@@ -42,6 +44,17 @@ class SessionManager:
         """
         self.session_timeout_seconds = session_timeout_seconds
         self._sessions: Dict[str, SessionContext] = {}
+        # Index of session IDs per user, in start order
+        self._user_sessions: Dict[str, List[str]] = {}
+
+        # Min-heap of (deadline, session_id) so cleanup only visits sessions
+        # that are due. Each session has one heap entry; activity only moves
+        # its live deadline in _deadlines and the heap entry is re-queued
+        # lazily when it comes due. Deadlines use
+        # time.monotonic() so wall-clock adjustments cannot expire sessions
+        # early; last_activity stays a datetime for display purposes.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
 
         logger.info(
             "session_manager_initialized",
@@ -81,6 +94,8 @@ class SessionManager:
             )
 
             self._sessions[session_id] = session
+            self._user_sessions.setdefault(user_id, []).append(session_id)
+            self._schedule_expiry(session_id)
 
             logger.info(
                 "session_started",
@@ -147,6 +162,7 @@ class SessionManager:
         try:
             # Update last activity
             session.last_activity = datetime.utcnow()
+            self._schedule_expiry(session_id)
 
             # Update active state
             if active is not None:
@@ -196,6 +212,8 @@ class SessionManager:
             # Remove from active sessions after a delay
             # (keep for a bit for potential queries)
             del self._sessions[session_id]
+            self._deadlines.pop(session_id, None)
+            self._unindex_user_session(session.user_id, session_id)
 
         except Exception as e:
             logger.error("session_end_failed", session_id=session_id, error=str(e))
@@ -228,6 +246,7 @@ class SessionManager:
 
         session.active = True
         session.last_activity = datetime.utcnow()
+        self._schedule_expiry(session_id)
 
         logger.info("session_resumed", session_id=session_id)
         return session
@@ -242,24 +261,76 @@ class SessionManager:
         Returns:
             True if expired
         """
-        if not session.last_activity:
+        deadline = self._deadlines.get(session.session_id)
+        if deadline is None:
             return False
 
-        elapsed = (datetime.utcnow() - session.last_activity).total_seconds()
-        return elapsed > self.session_timeout_seconds
+        return time.monotonic() > deadline
+
+    def _unindex_user_session(self, user_id: str, session_id: str) -> None:
+        """
+        Remove a session from the per-user index.
+
+        Args:
+            user_id: User the session belongs to
+            session_id: Session identifier
+        """
+        user_sessions = self._user_sessions.get(user_id)
+        if user_sessions is None:
+            return
+
+        if session_id in user_sessions:
+            user_sessions.remove(session_id)
+        if not user_sessions:
+            del self._user_sessions[user_id]
+
+    def _schedule_expiry(self, session_id: str) -> None:
+        """
+        Record the expiry deadline for a session after activity.
+
+        Args:
+            session_id: Session identifier
+        """
+        deadline = time.monotonic() + self.session_timeout_seconds
+        is_new = session_id not in self._deadlines
+        self._deadlines[session_id] = deadline
+
+        # Repeated activity on a tracked session coalesces into its existing
+        # heap entry; only new sessions push
+        if not is_new:
+            return
+
+        heapq.heappush(self._expiry_heap, (deadline, session_id))
+
+        # Drop entries left behind by ended sessions once they dominate the heap
+        if len(self._expiry_heap) > 2 * len(self._deadlines) + 64:
+            self._expiry_heap = [(d, sid) for sid, d in self._deadlines.items()]
+            heapq.heapify(self._expiry_heap)
 
     async def cleanup_expired_sessions(self) -> int:
         """
         Clean up expired sessions.
 
+        Only sessions whose deadline has passed are examined, so the cost is
+        proportional to the number of due sessions rather than all sessions.
+
         Returns:
             Number of sessions cleaned up
         """
-        expired_sessions = [
-            session_id
-            for session_id, session in self._sessions.items()
-            if self._is_expired(session)
-        ]
+        now = time.monotonic()
+        heap = self._expiry_heap
+        expired_sessions = []
+
+        while heap and heap[0][0] < now:
+            _, session_id = heapq.heappop(heap)
+            live_deadline = self._deadlines.get(session_id)
+            if live_deadline is None:
+                continue  # Session already ended
+            if live_deadline >= now:
+                # Touched since it was queued; re-queue at its live deadline
+                heapq.heappush(heap, (live_deadline, session_id))
+                continue
+            expired_sessions.append(session_id)
 
         for session_id in expired_sessions:
             await self.end_session(session_id)
@@ -269,6 +340,41 @@ class SessionManager:
 
         return len(expired_sessions)
 
+    def get_next_expiry_delay(self) -> Optional[float]:
+        """
+        Get seconds until the next session is due to expire.
+
+        Lets a background cleanup task sleep exactly until there is work to
+        do instead of polling on a fixed interval.
+
+        Returns:
+            Seconds until the earliest deadline (0.0 if already due), or None
+            if no sessions are tracked
+
+        Example:
+            >>> delay = manager.get_next_expiry_delay()
+            >>> if delay is not None:
+            ...     await asyncio.sleep(delay)
+            ...     await manager.cleanup_expired_sessions()
+        """
+        heap = self._expiry_heap
+
+        # Settle the head so the answer reflects a live deadline
+        while heap:
+            deadline, session_id = heap[0]
+            live_deadline = self._deadlines.get(session_id)
+            if live_deadline is None:
+                heapq.heappop(heap)
+            elif live_deadline != deadline:
+                heapq.heapreplace(heap, (live_deadline, session_id))
+            else:
+                break
+
+        if not heap:
+            return None
+
+        return max(0.0, heap[0][0] - time.monotonic())
+
     def list_active_sessions(self, user_id: Optional[str] = None) -> list[str]:
         """
         List active session IDs.
@@ -279,12 +385,15 @@ class SessionManager:
         Returns:
             List of active session IDs
         """
-        sessions = [
-            session_id
-            for session_id, session in self._sessions.items()
-            if session.active and (user_id is None or session.user_id == user_id)
-        ]
-        return sessions
+        if user_id is not None:
+            # Use the per-user index instead of scanning every session
+            return [
+                session_id
+                for session_id in self._user_sessions.get(user_id, ())
+                if self._sessions[session_id].active
+            ]
+
+        return [session_id for session_id, session in self._sessions.items() if session.active]
 
     def get_statistics(self) -> Dict[str, Any]:
         """
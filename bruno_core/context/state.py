@@ -4,15 +4,25 @@ State Manager implementation.
 Manages persistent state storage and retrieval for conversations and sessions.
 """
 
+import asyncio
 import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from bruno_core.utils.exceptions import StateError
 from bruno_core.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_MISSING = object()
+
+T = TypeVar("T")
+
 
 class StateManager:
     """
@@ -24,17 +34,28 @@ class StateManager:
     - File-based or in-memory storage
     - Namespace support
     - Atomic writes
+    - File I/O runs on a dedicated worker thread, off the event loop
+
+    The worker thread is started on the first file operation and released
+    by close(), by leaving an ``async with`` block, or when the manager is
+    garbage collected.
 
     Example:
         >>> manager = StateManager(storage_path="./state")
         >>> await manager.set_state("user_123", "preferences", {"theme": "dark"})
         >>> prefs = await manager.get_state("user_123", "preferences")
+
+        >>> async with StateManager(storage_path="./state") as manager:
+        ...     await manager.set_state("user_123", "theme", "dark")
     """
 
     def __init__(
         self,
         storage_path: Optional[str] = None,
         use_memory: bool = False,
+        json_indent: Optional[int] = None,
+        cache_size: int = 0,
+        offload_io: bool = True,
     ):
         """
         Initialize state manager.
@@ -42,15 +63,38 @@ class StateManager:
         Args:
             storage_path: Path to state storage directory (None for temp)
             use_memory: Use in-memory storage instead of files
+            json_indent: Indentation for state files. Defaults to compact JSON,
+                which is smaller and faster to encode; pass 2 for files meant
+                to be read by hand
+            cache_size: Number of recently used state files kept in memory
+                (file-based storage only). Disabled by default; only enable
+                it when this manager is the sole writer of storage_path,
+                since changes made by other managers or processes are not
+                seen while a key stays cached
+            offload_io: Run file operations on a dedicated worker thread so
+                they never block the event loop (file-based storage only)
         """
         self.use_memory = use_memory
+        self.json_indent = json_indent
         self._memory_store: Dict[str, Dict[str, Any]] = {}
         self.storage_path: Optional[Path]
+        # LRU cache of raw file contents, refreshed on writes and dropped on deletes
+        self.cache_size = cache_size
+        self._read_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # Single worker so file operations (and the cache) stay serialized;
+        # created on first use
+        self.offload_io = offload_io
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._io_finalizer: Optional[weakref.finalize] = None
 
         if not use_memory:
             self.storage_path = Path(storage_path) if storage_path else Path("./bruno_state")
             self.storage_path.mkdir(parents=True, exist_ok=True)
-            logger.info("state_manager_initialized", storage_path=str(self.storage_path))
+            logger.info(
+                "state_manager_initialized",
+                storage_path=str(self.storage_path),
+                json_indent=json_indent,
+            )
         else:
             self.storage_path = None
             logger.info("state_manager_initialized", mode="in-memory")
@@ -74,24 +118,10 @@ class StateManager:
         """
         try:
             if self.use_memory:
-                if namespace not in self._memory_store:
-                    self._memory_store[namespace] = {}
-                self._memory_store[namespace][key] = value
+                self._memory_store.setdefault(namespace, {})[key] = value
             else:
                 # File-based storage
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                namespace_dir = self.storage_path / namespace
-                namespace_dir.mkdir(exist_ok=True)
-
-                state_file = namespace_dir / f"{key}.json"
-
-                # Write atomically
-                temp_file = state_file.with_suffix(".tmp")
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(value, f, indent=2, ensure_ascii=False)
-
-                temp_file.replace(state_file)
+                await self._run_io(self._file_set, namespace, {key: value})
 
             logger.debug("state_set", namespace=namespace, key=key)
 
@@ -108,6 +138,51 @@ class StateManager:
                 cause=e,
             )
 
+    async def set_states(
+        self,
+        namespace: str,
+        values: Dict[str, Any],
+    ) -> None:
+        """
+        Set several state values in one call.
+
+        The namespace is resolved once for the whole batch, so bulk updates
+        avoid the per-call overhead of repeated set_state() calls.
+
+        Args:
+            namespace: State namespace
+            values: Mapping of state keys to values (must be JSON serializable)
+
+        Raises:
+            StateError: If storage fails
+
+        Example:
+            >>> await manager.set_states("user_123", {"theme": "dark", "lang": "en"})
+        """
+        if not values:
+            return
+
+        try:
+            if self.use_memory:
+                self._memory_store.setdefault(namespace, {}).update(values)
+            else:
+                await self._run_io(self._file_set, namespace, values)
+
+            logger.debug("states_set", namespace=namespace, count=len(values))
+
+        except Exception as e:
+            logger.error(
+                "states_set_failed",
+                namespace=namespace,
+                count=len(values),
+                error=str(e),
+            )
+            raise StateError(
+                "Failed to set state",
+                details={"namespace": namespace, "keys": list(values)},
+                cause=e,
+            )
+
     async def get_state(
         self,
         namespace: str,
@@ -129,15 +204,12 @@ class StateManager:
             if self.use_memory:
                 return self._memory_store.get(namespace, {}).get(key, default)
             else:
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                state_file = self.storage_path / namespace / f"{key}.json"
-
-                if not state_file.exists():
+                raw = await self._run_io(self._file_read, namespace, key)
+                if raw is None:
                     return default
 
-                with open(state_file, "r", encoding="utf-8") as f:
-                    value = json.load(f)
+                # Decode on every read so callers never share mutable objects
+                value = json.loads(raw)
 
                 logger.debug("state_retrieved", namespace=namespace, key=key)
                 return value
@@ -168,21 +240,16 @@ class StateManager:
         """
         try:
             if self.use_memory:
-                if namespace in self._memory_store and key in self._memory_store[namespace]:
-                    del self._memory_store[namespace][key]
-                    logger.debug("state_deleted", namespace=namespace, key=key)
-                    return True
-                return False
+                store = self._memory_store.get(namespace)
+                if store is None or store.pop(key, _MISSING) is _MISSING:
+                    return False
+                logger.debug("state_deleted", namespace=namespace, key=key)
+                return True
             else:
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                state_file = self.storage_path / namespace / f"{key}.json"
-
-                if state_file.exists():
-                    state_file.unlink()
-                    logger.debug("state_deleted", namespace=namespace, key=key)
-                    return True
-                return False
+                if not await self._run_io(self._file_delete, namespace, [key]):
+                    return False
+                logger.debug("state_deleted", namespace=namespace, key=key)
+                return True
 
         except Exception as e:
             logger.error(
@@ -193,6 +260,48 @@ class StateManager:
             )
             return False
 
+    async def delete_states(
+        self,
+        namespace: str,
+        keys: List[str],
+    ) -> int:
+        """
+        Delete several state values in one call.
+
+        Args:
+            namespace: State namespace
+            keys: State keys to delete
+
+        Returns:
+            Number of keys actually deleted
+
+        Example:
+            >>> await manager.delete_states("user_123", ["theme", "lang"])
+            2
+        """
+        deleted = 0
+        try:
+            if self.use_memory:
+                store = self._memory_store.get(namespace)
+                if store:
+                    for key in keys:
+                        if store.pop(key, _MISSING) is not _MISSING:
+                            deleted += 1
+            else:
+                deleted = await self._run_io(self._file_delete, namespace, keys)
+
+            logger.debug("states_deleted", namespace=namespace, count=deleted)
+            return deleted
+
+        except Exception as e:
+            logger.error(
+                "states_delete_failed",
+                namespace=namespace,
+                count=len(keys),
+                error=str(e),
+            )
+            return deleted
+
     async def list_keys(self, namespace: str) -> list[str]:
         """
         List all keys in a namespace.
@@ -207,15 +316,7 @@ class StateManager:
             if self.use_memory:
                 return list(self._memory_store.get(namespace, {}).keys())
             else:
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                namespace_dir = self.storage_path / namespace
-
-                if not namespace_dir.exists():
-                    return []
-
-                keys = [f.stem for f in namespace_dir.glob("*.json")]
-                return keys
+                return await self._run_io(self._file_list_keys, namespace)
 
         except Exception as e:
             logger.error("list_keys_failed", namespace=namespace, error=str(e))
@@ -233,31 +334,17 @@ class StateManager:
         """
         try:
             if self.use_memory:
-                if namespace in self._memory_store:
-                    count = len(self._memory_store[namespace])
-                    del self._memory_store[namespace]
-                    logger.info("namespace_cleared", namespace=namespace, count=count)
-                    return count
-                return 0
-            else:
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                namespace_dir = self.storage_path / namespace
-
-                if not namespace_dir.exists():
+                store = self._memory_store.pop(namespace, None)
+                if store is None:
                     return 0
-
-                count = 0
-                for state_file in namespace_dir.glob("*.json"):
-                    state_file.unlink()
-                    count += 1
-
-                # Remove directory if empty
-                if not any(namespace_dir.iterdir()):
-                    namespace_dir.rmdir()
-
+                count = len(store)
                 logger.info("namespace_cleared", namespace=namespace, count=count)
                 return count
+            else:
+                count = await self._run_io(self._file_clear_namespace, namespace)
+                if count:
+                    logger.info("namespace_cleared", namespace=namespace, count=count)
+                return count
 
         except Exception as e:
             logger.error("clear_namespace_failed", namespace=namespace, error=str(e))
@@ -274,13 +361,7 @@ class StateManager:
             if self.use_memory:
                 return list(self._memory_store.keys())
             else:
-                if self.storage_path is None:
-                    raise StateError("Storage path not configured")
-                if not self.storage_path.exists():
-                    return []
-
-                namespaces = [d.name for d in self.storage_path.iterdir() if d.is_dir()]
-                return namespaces
+                return await self._run_io(self._file_list_namespaces)
 
         except Exception as e:
             logger.error("list_namespaces_failed", error=str(e))
@@ -290,6 +371,9 @@ class StateManager:
         """
         Get state manager statistics.
 
+        For file-based storage this scans the storage directory on the
+        calling thread, so avoid calling it on hot paths of the event loop.
+
         Returns:
             Dict with statistics
         """
@@ -310,22 +394,199 @@ class StateManager:
                         "total_keys": 0,
                     }
 
-                namespaces = 0
-                total_keys = 0
+                # scandir entries carry their file type, so no stat per entry
+                try:
+                    with os.scandir(self.storage_path) as entries:
+                        namespace_dirs = [entry.path for entry in entries if entry.is_dir()]
+                except FileNotFoundError:
+                    namespace_dirs = []
 
-                if self.storage_path.exists():
-                    for namespace_dir in self.storage_path.iterdir():
-                        if namespace_dir.is_dir():
-                            namespaces += 1
-                            total_keys += len(list(namespace_dir.glob("*.json")))
+                total_keys = 0
+                for namespace_dir in namespace_dirs:
+                    with os.scandir(namespace_dir) as files:
+                        total_keys += sum(1 for f in files if f.name.endswith(".json"))
 
                 return {
                     "mode": "file-based",
                     "storage_path": str(self.storage_path),
-                    "namespaces": namespaces,
+                    "namespaces": len(namespace_dirs),
                     "total_keys": total_keys,
                 }
 
         except Exception as e:
             logger.error("get_statistics_failed", error=str(e))
             return {"error": str(e)}
+
+    def close(self) -> None:
+        """
+        Release the file I/O worker thread.
+
+        The worker is recreated on demand, so the manager stays usable.
+        """
+        if self._io_executor is not None:
+            if self._io_finalizer is not None:
+                self._io_finalizer.detach()
+                self._io_finalizer = None
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+
+    async def __aenter__(self) -> "StateManager":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        """Exit async context, releasing the file I/O worker thread."""
+        self.close()
+
+    async def _run_io(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking file operation.
+
+        Args:
+            func: Synchronous function to run
+            *args: Positional arguments for func
+
+        Returns:
+            The function's result
+        """
+        if not self.offload_io:
+            return func(*args)
+
+        executor = self._io_executor
+        if executor is None:
+            executor = self._io_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="bruno-state-io"
+            )
+            # Stop the worker if the manager is dropped without close()
+            self._io_finalizer = weakref.finalize(self, executor.shutdown, wait=False)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
+
+    def _file_set(self, namespace: str, values: Dict[str, Any]) -> None:
+        """Write state files for a namespace."""
+        namespace_dir = self._namespace_path(namespace)
+        for key, value in values.items():
+            self._write_file(namespace, namespace_dir, key, value)
+
+    def _file_read(self, namespace: str, key: str) -> Optional[str]:
+        """Read raw state file contents, or None if the key does not exist."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+
+        cache_key = (namespace, key)
+        raw = self._read_cache.get(cache_key)
+        if raw is not None:
+            self._read_cache.move_to_end(cache_key)
+            return raw
+
+        state_file = self._namespace_path(namespace) / f"{key}.json"
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+
+        self._cache_put(cache_key, raw)
+        return raw
+
+    def _file_delete(self, namespace: str, keys: List[str]) -> int:
+        """Delete state files, returning how many existed."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+
+        namespace_dir = self._namespace_path(namespace)
+        deleted = 0
+        for key in keys:
+            self._read_cache.pop((namespace, key), None)
+            try:
+                (namespace_dir / f"{key}.json").unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+
+    def _file_list_keys(self, namespace: str) -> List[str]:
+        """List keys stored in a namespace directory."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+
+        # glob() on a missing directory simply yields nothing
+        return [f.stem for f in self._namespace_path(namespace).glob("*.json")]
+
+    def _file_clear_namespace(self, namespace: str) -> int:
+        """Delete every state file in a namespace directory."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+
+        namespace_dir = self._namespace_path(namespace)
+        for cache_key in [k for k in self._read_cache if k[0] == namespace]:
+            del self._read_cache[cache_key]
+
+        count = 0
+        for state_file in namespace_dir.glob("*.json"):
+            state_file.unlink()
+            count += 1
+
+        # Remove directory if empty; rmdir itself is the emptiness check
+        try:
+            namespace_dir.rmdir()
+        except OSError:
+            pass  # Missing, or still holds non-state files
+
+        return count
+
+    def _file_list_namespaces(self) -> List[str]:
+        """List namespace directories."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+
+        try:
+            with os.scandir(self.storage_path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+
+    def _namespace_path(self, namespace: str) -> Path:
+        """Return the directory path for a namespace."""
+        if self.storage_path is None:
+            raise StateError("Storage path not configured")
+        return self.storage_path / namespace
+
+    def _write_file(self, namespace: str, namespace_dir: Path, key: str, value: Any) -> None:
+        """Atomically write a single state file."""
+        cache_key = (namespace, key)
+        data = json.dumps(value, indent=self.json_indent, ensure_ascii=False)
+        self._read_cache.pop(cache_key, None)
+
+        state_file = namespace_dir / f"{key}.json"
+
+        # Write atomically; the temp name is per process and thread so
+        # concurrent writers of the same key never share a half-written file
+        temp_file = namespace_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            f = open(temp_file, "w", encoding="utf-8")
+        except FileNotFoundError:
+            # First write to the namespace, or its directory was removed;
+            # create it and retry, so existing namespaces skip the mkdir
+            namespace_dir.mkdir(parents=True, exist_ok=True)
+            f = open(temp_file, "w", encoding="utf-8")
+        try:
+            with f:
+                f.write(data)
+            temp_file.replace(state_file)
+        except BaseException:
+            # Do not leave a stray temp file behind for a failed write
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+            raise
+        self._cache_put(cache_key, data)
+
+    def _cache_put(self, cache_key: Tuple[str, str], raw: str) -> None:
+        """Insert raw file contents into the read cache, evicting the oldest."""
+        if self.cache_size <= 0:
+            return
+        self._read_cache[cache_key] = raw
+        if len(self._read_cache) > self.cache_size:
+            self._read_cache.popitem(last=False)
@@ -5,8 +5,9 @@ Provides pub/sub mechanism for decoupled component communication.
 """
 
 import asyncio
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set
+from collections import defaultdict, deque
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from bruno_core.events.types import Event, EventType
 from bruno_core.utils.logging import get_logger
@@ -54,8 +55,13 @@ class EventBus:
         # Wildcard handlers (receive all events)
         self._wildcard_handlers: List[Callable] = []
 
-        # Event history
-        self._history: List[Event] = []
+        # (handler, is_async) pairs per event type, in dispatch order (type
+        # handlers by priority, then wildcards). Built on first publish and
+        # dropped whenever subscriptions change.
+        self._dispatch_cache: Dict[EventType, Tuple[Tuple[Callable[[Event], Any], bool], ...]] = {}
+
+        # Event history (bounded ring buffer, oldest events fall off the front)
+        self._history: Deque[Event] = deque(maxlen=max_history)
 
         # Statistics
         self._stats = {
@@ -82,10 +88,13 @@ class EventBus:
         """
         # Store with priority
         handler_tuple: tuple[int, Callable[[Event], Any]] = (priority, handler)
-        self._handlers[event_type].append(handler_tuple)
+        handlers = self._handlers[event_type]
 
-        # Sort by priority (descending)
-        self._handlers[event_type].sort(key=lambda x: x[0], reverse=True)
+        # The list is kept sorted by priority (descending), so insert after the
+        # last handler of equal or higher priority instead of re-sorting
+        index = next((i for i, (p, _) in enumerate(handlers) if p < priority), len(handlers))
+        handlers.insert(index, handler_tuple)
+        self._dispatch_cache.pop(event_type, None)
 
         logger.info(
             "handler_subscribed",
@@ -102,6 +111,7 @@ class EventBus:
             handler: Handler function for all events
         """
         self._wildcard_handlers.append(handler)
+        self._dispatch_cache.clear()
         logger.info("wildcard_handler_subscribed", handler=handler.__name__)
 
     def unsubscribe(
@@ -119,14 +129,16 @@ class EventBus:
         Returns:
             True if handler was found and removed
         """
-        if event_type not in self._handlers:
+        handlers = self._handlers.get(event_type)
+        if handlers is None:
             return False
 
-        original_count = len(self._handlers[event_type])
-        self._handlers[event_type] = [(p, h) for p, h in self._handlers[event_type] if h != handler]
+        remaining = [(p, h) for p, h in handlers if h != handler]
+        self._handlers[event_type] = remaining
 
-        removed = len(self._handlers[event_type]) < original_count
+        removed = len(remaining) < len(handlers)
         if removed:
+            self._dispatch_cache.pop(event_type, None)
             logger.info(
                 "handler_unsubscribed",
                 event_type=event_type.value,
@@ -147,6 +159,7 @@ class EventBus:
         """
         if handler in self._wildcard_handlers:
             self._wildcard_handlers.remove(handler)
+            self._dispatch_cache.clear()
             logger.info("wildcard_handler_unsubscribed", handler=handler.__name__)
             return True
         return False
@@ -164,55 +177,107 @@ class EventBus:
             # Add to history
             if self.enable_history:
                 self._history.append(event)
-                if len(self._history) > self.max_history:
-                    self._history.pop(0)
 
-            logger.debug(
-                "event_published",
-                event_type=event.event_type,
-                event_id=event.event_id,
-            )
+            await self._dispatch(event)
+
+        except Exception as e:
+            logger.error("publish_error", event_type=event.event_type, error=str(e))
+
+    async def publish_many(self, events: List[Event]) -> None:
+        """
+        Publish multiple events.
+
+        Bookkeeping (statistics and history) is done once for the
+        whole batch; handlers still receive the events in order.
 
-            # Get handlers for this event type
-            handlers = self._handlers.get(event.event_type, [])
+        Args:
+            events: List of events to publish
+        """
+        if not events:
+            return
+
+        try:
+            self._stats["published"] += len(events)
 
-            # Add wildcard handlers
-            wildcard_handlers: List[tuple[int, Callable[[Event], Any]]] = [
-                (0, h) for h in self._wildcard_handlers
-            ]
-            all_handlers = handlers + wildcard_handlers
+            if self.enable_history:
+                self._history.extend(events)
+
+        except Exception as e:
+            logger.error("publish_error", count=len(events), error=str(e))
+            return
+
+        for event in events:
+            try:
+                await self._dispatch(event)
+            except Exception as e:
+                logger.error("publish_error", event_type=event.event_type, error=str(e))
 
-            # Execute handlers
-            for priority, handler in all_handlers:
+    async def _dispatch(self, event: Event) -> None:
+        """
+        Deliver an event to its handlers and wildcard handlers.
+
+        Args:
+            event: Event to deliver
+        """
+        event_type = event.event_type
+        logger.debug(
+            "event_published",
+            event_type=event_type,
+            event_id=event.event_id,
+        )
+
+        # Handlers for this event type followed by wildcard handlers; the
+        # tuple is a snapshot, so (un)subscribing from a handler is safe
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            handlers = self._build_dispatch_list(event_type)
+            self._dispatch_cache[event_type] = handlers
+
+        # Nobody is listening for this event type
+        if not handlers:
+            return
+
+        # Execute handlers, adding the handled count to the stats once
+        handled = 0
+        try:
+            for handler, is_async in handlers:
                 try:
-                    if asyncio.iscoroutinefunction(handler):
+                    if is_async:
                         await handler(event)
                     else:
                         handler(event)
 
-                    self._stats["handled"] += 1
+                    handled += 1
 
                 except Exception as e:
                     self._stats["errors"] += 1
                     logger.error(
                         "handler_error",
-                        event_type=event.event_type,
+                        event_type=event_type,
                         handler=handler.__name__,
                         error=str(e),
                     )
+        finally:
+            self._stats["handled"] += handled
 
-        except Exception as e:
-            logger.error("publish_error", event_type=event.event_type, error=str(e))
-
-    async def publish_many(self, events: List[Event]) -> None:
+    def _build_dispatch_list(
+        self, event_type: EventType
+    ) -> Tuple[Tuple[Callable[[Event], Any], bool], ...]:
         """
-        Publish multiple events.
+        Build the handlers to call for an event type.
+
+        Whether each handler is a coroutine function is resolved here once,
+        rather than on every dispatch.
 
         Args:
-            events: List of events to publish
+            event_type: Event type being dispatched
+
+        Returns:
+            Tuple of (handler, is_async) pairs in dispatch order
         """
-        for event in events:
-            await self.publish(event)
+        handlers = [h for _, h in self._handlers.get(event_type, ())]
+        handlers.extend(self._wildcard_handlers)
+        return tuple((h, asyncio.iscoroutinefunction(h)) for h in handlers)
 
     def get_history(
         self,
@@ -232,15 +297,16 @@ class EventBus:
         if not self.enable_history:
             return []
 
-        history = self._history[::-1]  # Reverse to get most recent first
+        # Walk from the newest event and stop as soon as the limit is reached
+        events: Iterable[Event] = reversed(self._history)
 
         if event_type:
-            history = [e for e in history if e.event_type == event_type]
+            events = (e for e in events if e.event_type == event_type)
 
         if limit:
-            history = history[:limit]
+            events = islice(events, limit)
 
-        return history
+        return list(events)
 
     def clear_history(self) -> None:
         """Clear event history."""
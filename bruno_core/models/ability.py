@@ -6,7 +6,7 @@ Defines structures for ability requests, responses, and metadata.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -24,6 +24,17 @@ class AbilityParameterType(str, Enum):
     ANY = "any"
 
 
+# Accepted Python types per parameter type (ANY is not type-checked)
+_PARAMETER_PYTHON_TYPES: Dict[AbilityParameterType, Tuple[type, ...]] = {
+    AbilityParameterType.STRING: (str,),
+    AbilityParameterType.INTEGER: (int,),
+    AbilityParameterType.FLOAT: (int, float),
+    AbilityParameterType.BOOLEAN: (bool,),
+    AbilityParameterType.LIST: (list,),
+    AbilityParameterType.DICT: (dict,),
+}
+
+
 class AbilityParameter(BaseModel):
     """
     Parameter definition for an ability.
@@ -64,19 +75,13 @@ class AbilityParameter(BaseModel):
             True if valid, False otherwise
         """
         # Basic type checking
-        if self.param_type == AbilityParameterType.STRING and not isinstance(value, str):
-            return False
-        elif self.param_type == AbilityParameterType.INTEGER and not isinstance(value, int):
-            return False
-        elif self.param_type == AbilityParameterType.FLOAT and not isinstance(value, (int, float)):
-            return False
-        elif self.param_type == AbilityParameterType.BOOLEAN and not isinstance(value, bool):
-            return False
-        elif self.param_type == AbilityParameterType.LIST and not isinstance(value, list):
-            return False
-        elif self.param_type == AbilityParameterType.DICT and not isinstance(value, dict):
+        expected_types = _PARAMETER_PYTHON_TYPES.get(self.param_type)
+        if expected_types is not None and not isinstance(value, expected_types):
             return False
 
+        if not self.constraints:
+            return True
+
         # Check constraints
         if "min" in self.constraints and value < self.constraints["min"]:
             return False
@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+_LOG_FORMATS = frozenset({"json", "text"})
+
 
 class LLMConfig(BaseModel):
     """
@@ -177,6 +179,6 @@ class BrunoConfig(BaseModel):
     @classmethod
     def validate_log_format(cls, v: str) -> str:
         """Validate log format."""
-        if v not in ["json", "text"]:
+        if v not in _LOG_FORMATS:
             raise ValueError("log_format must be 'json' or 'text'")
         return v.lower()
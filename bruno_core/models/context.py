@@ -10,7 +10,13 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from bruno_core.models.message import Message
+from bruno_core.models.message import Message, MessageRole
+
+# Role members bound once, so message scans compare against a module global
+# instead of reading .value off every message's role
+_SYSTEM_ROLE = MessageRole.SYSTEM
+_USER_ROLE = MessageRole.USER
+_ASSISTANT_ROLE = MessageRole.ASSISTANT
 
 
 class UserContext(BaseModel):
@@ -217,8 +223,13 @@ class ConversationContext(BaseModel):
         # Maintain rolling window
         if len(self.messages) > self.max_messages:
             # Keep system messages, remove oldest user/assistant messages
-            system_messages = [m for m in self.messages if m.role.value == "system"]
-            other_messages = [m for m in self.messages if m.role.value != "system"]
+            system_messages: List[Message] = []
+            other_messages: List[Message] = []
+            for m in self.messages:
+                if m.role == _SYSTEM_ROLE:
+                    system_messages.append(m)
+                else:
+                    other_messages.append(m)
 
             # Keep most recent messages
             keep_count = self.max_messages - len(system_messages)
@@ -259,7 +270,7 @@ class ConversationContext(BaseModel):
             keep_system: If True, keep system messages
         """
         if keep_system:
-            self.messages = [m for m in self.messages if m.role.value == "system"]
+            self.messages = [m for m in self.messages if m.role == _SYSTEM_ROLE]
         else:
             self.messages = []
 
@@ -270,13 +281,13 @@ class ConversationContext(BaseModel):
     def get_last_user_message(self) -> Optional[Message]:
         """Get the most recent user message."""
         for msg in reversed(self.messages):
-            if msg.role.value == "user":
+            if msg.role == _USER_ROLE:
                 return msg
         return None
 
     def get_last_assistant_message(self) -> Optional[Message]:
         """Get the most recent assistant message."""
         for msg in reversed(self.messages):
-            if msg.role.value == "assistant":
+            if msg.role == _ASSISTANT_ROLE:
                 return msg
         return None
@@ -6,7 +6,6 @@ Manages ability plugin discovery and registration.
 
 from typing import Type
 
-from bruno_core.interfaces.ability import AbilityInterface
 from bruno_core.registry.base import PluginRegistry
 from bruno_core.utils.logging import get_logger
 
@@ -5,15 +5,39 @@ Provides common functionality for all plugin registries.
 """
 
 import importlib.metadata
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from bruno_core.utils.exceptions import RegistryError, ValidationError
 from bruno_core.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# entry_points() reads metadata for every installed distribution, and each
+# registry calls it during discovery. Share one scan for a short time.
+_ENTRY_POINTS_TTL_SECONDS = 5.0
+_entry_points_cache: Optional[Tuple[float, Any]] = None
+
+
+def _get_entry_points() -> Any:
+    """
+    Get installed entry points, reusing a recent scan.
+
+    Returns:
+        Result of importlib.metadata.entry_points()
+    """
+    global _entry_points_cache
+
+    now = time.monotonic()
+    if _entry_points_cache is not None and now - _entry_points_cache[0] < _ENTRY_POINTS_TTL_SECONDS:
+        return _entry_points_cache[1]
+
+    entry_points = importlib.metadata.entry_points()
+    _entry_points_cache = (now, entry_points)
+    return entry_points
+
 
 @dataclass
 class PluginInfo:
@@ -48,7 +72,7 @@ class PluginRegistry(ABC):
 
     Provides common functionality for discovering, registering, and managing plugins.
     Subclasses should implement get_entry_point_group() to specify which entry point
-    group to scan.
+    group to scan. Discovered plugins are only imported when first requested.
 
     Example:
         >>> class MyRegistry(PluginRegistry):
@@ -62,7 +86,11 @@ class PluginRegistry(ABC):
     def __init__(self) -> None:
         """Initialize plugin registry."""
         self._plugins: Dict[str, PluginInfo] = {}
-        self._instances: Dict[str, Any] = {}
+        # Shared instances per plugin, keyed by their constructor arguments
+        # (the empty key holds the default get_instance() singleton)
+        self._instances: Dict[str, Dict[Tuple[Tuple[str, Any], ...], Any]] = {}
+        # Discovered entry points whose plugin modules have not been imported yet
+        self._pending: Dict[str, Any] = {}
         logger.info("registry_initialized", registry=self.__class__.__name__)
 
     @abstractmethod
@@ -90,15 +118,16 @@ class PluginRegistry(ABC):
 
     def discover_plugins(self) -> None:
         """
-        Discover and register plugins from entry points.
+        Discover plugins from entry points.
 
-        Scans the entry point group and registers all found plugins.
+        Scans the entry point group and records the plugins found. Each plugin
+        is imported, validated and registered the first time it is requested.
         """
         group = self.get_entry_point_group()
         logger.info("discovering_plugins", group=group)
 
         try:
-            entry_points = importlib.metadata.entry_points()
+            entry_points = _get_entry_points()
 
             # Handle both dict and list-like entry point objects
             if hasattr(entry_points, "select"):
@@ -112,28 +141,61 @@ class PluginRegistry(ABC):
                 group_eps = [ep for ep in entry_points if ep.group == group]
 
             for entry_point in group_eps:
-                try:
-                    plugin_class = entry_point.load()
-                    self.register(
-                        name=entry_point.name,
-                        plugin_class=plugin_class,
-                        entry_point=entry_point.name,
-                    )
-                    logger.info(
-                        "plugin_discovered",
-                        name=entry_point.name,
-                        group=group,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "plugin_discovery_failed",
-                        entry_point=entry_point.name,
-                        error=str(e),
-                    )
+                if self.has_plugin(entry_point.name):
+                    logger.warning("plugin_already_registered", name=entry_point.name)
+                    continue
+
+                self._pending[entry_point.name] = entry_point
+                logger.info(
+                    "plugin_discovered",
+                    name=entry_point.name,
+                    group=group,
+                )
 
         except Exception as e:
             logger.error("discovery_failed", group=group, error=str(e))
 
+    def _load_pending(self, name: str) -> Optional[PluginInfo]:
+        """
+        Import and register a discovered plugin on first use.
+
+        Args:
+            name: Plugin name
+
+        Returns:
+            PluginInfo, or None if the plugin is unknown
+
+        Raises:
+            RegistryError: If the plugin cannot be loaded or is invalid
+        """
+        info = self._plugins.get(name)
+        if info is not None:
+            return info
+
+        entry_point = self._pending.pop(name, None)
+        if entry_point is None:
+            return None
+
+        try:
+            plugin_class = entry_point.load()
+        except Exception as e:
+            raise RegistryError(
+                f"Failed to load plugin: {name}",
+                details={"name": name, "error": str(e)},
+                cause=e,
+            )
+
+        self.register(name=name, plugin_class=plugin_class, entry_point=entry_point.name)
+        return self._plugins[name]
+
+    def _load_all_pending(self) -> None:
+        """Load every discovered plugin, logging the ones that fail."""
+        for name in list(self._pending):
+            try:
+                self._load_pending(name)
+            except RegistryError as e:
+                logger.error("plugin_discovery_failed", entry_point=name, error=str(e))
+
     def register(
         self,
         name: str,
@@ -168,6 +230,7 @@ class PluginRegistry(ABC):
         if name in self._plugins:
             logger.warning("plugin_already_registered", name=name)
             return
+        self._pending.pop(name, None)
 
         # Create plugin info
         info = PluginInfo(
@@ -192,15 +255,19 @@ class PluginRegistry(ABC):
         Raises:
             RegistryError: If plugin not found
         """
+        if name in self._pending:
+            del self._pending[name]
+            logger.info("plugin_unregistered", name=name)
+            return
+
         if name not in self._plugins:
             raise RegistryError(
                 f"Plugin not found: {name}",
                 details={"name": name},
             )
 
-        # Remove instance if exists
-        if name in self._instances:
-            del self._instances[name]
+        # Remove instances if they exist
+        self._instances.pop(name, None)
 
         del self._plugins[name]
         logger.info("plugin_unregistered", name=name)
@@ -213,9 +280,13 @@ class PluginRegistry(ABC):
             name: Plugin name
 
         Returns:
-            PluginInfo or None if not found
+            PluginInfo or None if not found (or it failed to load)
         """
-        return self._plugins.get(name)
+        try:
+            return self._load_pending(name)
+        except RegistryError as e:
+            logger.error("plugin_discovery_failed", entry_point=name, error=str(e))
+            return None
 
     def get_instance(self, name: str, **kwargs: Any) -> Any:
         """
@@ -229,27 +300,102 @@ class PluginRegistry(ABC):
             Plugin instance
 
         Raises:
-            RegistryError: If plugin not found
+            RegistryError: If plugin not found or cannot be loaded
         """
-        if name not in self._plugins:
+        self._require(name)
+
+        # Return cached instance if exists and no kwargs provided
+        instances = self._instances.get(name)
+        if not kwargs and instances is not None and () in instances:
+            return instances[()]
+
+        instance = self._instantiate(name, kwargs)
+
+        # Cache if no kwargs (shared instance)
+        if not kwargs:
+            self._instances.setdefault(name, {})[()] = instance
+
+        return instance
+
+    def get_shared_instance(self, name: str, **kwargs: Any) -> Any:
+        """
+        Get or create a plugin instance shared per constructor arguments.
+
+        Callers passing equal arguments get the same object, so several
+        components configuring the same provider reuse one client instead
+        of each opening their own. Only use this for plugins that are safe
+        to share: shutting the instance down affects every holder. Shared
+        instances are kept until the plugin is unregistered or the registry
+        is cleared. Calls with unhashable arguments always get a new
+        instance.
+
+        Args:
+            name: Plugin name
+            **kwargs: Arguments to pass to plugin constructor
+
+        Returns:
+            Plugin instance
+
+        Raises:
+            RegistryError: If plugin not found or cannot be loaded
+
+        Example:
+            >>> client = registry.get_shared_instance('openai', api_key='...')
+        """
+        self._require(name)
+
+        key: Optional[Tuple[Tuple[str, Any], ...]] = tuple(sorted(kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+
+        # Return cached instance if one was built with the same arguments
+        instances = self._instances.get(name)
+        if key is not None and instances is not None and key in instances:
+            return instances[key]
+
+        instance = self._instantiate(name, kwargs)
+
+        # Cache if the arguments can key a shared instance
+        if key is not None:
+            self._instances.setdefault(name, {})[key] = instance
+
+        return instance
+
+    def _require(self, name: str) -> None:
+        """
+        Ensure a plugin is registered, loading it if it was only discovered.
+
+        Args:
+            name: Plugin name
+
+        Raises:
+            RegistryError: If plugin not found or cannot be loaded
+        """
+        if self._load_pending(name) is None:
             raise RegistryError(
                 f"Plugin not found: {name}",
                 details={"name": name},
             )
 
-        # Return cached instance if exists and no kwargs provided
-        if name in self._instances and not kwargs:
-            return self._instances[name]
+    def _instantiate(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        """
+        Create a new plugin instance.
 
-        # Create new instance
+        Args:
+            name: Plugin name
+            kwargs: Arguments to pass to plugin constructor
+
+        Returns:
+            Plugin instance
+
+        Raises:
+            RegistryError: If the plugin constructor fails
+        """
         info = self._plugins[name]
         try:
             instance = info.plugin_class(**kwargs)
-
-            # Cache if no kwargs (shared instance)
-            if not kwargs:
-                self._instances[name] = instance
-
             logger.info("plugin_instantiated", name=name)
             return instance
 
@@ -265,9 +411,9 @@ class PluginRegistry(ABC):
         List all registered plugin names.
 
         Returns:
-            List of plugin names
+            List of plugin names, including discovered plugins not yet loaded
         """
-        return list(self._plugins.keys())
+        return list(self._plugins.keys()) + list(self._pending.keys())
 
     def get_all_plugins(self) -> Dict[str, PluginInfo]:
         """
@@ -276,12 +422,14 @@ class PluginRegistry(ABC):
         Returns:
             Dict of plugin name to PluginInfo
         """
+        self._load_all_pending()
         return self._plugins.copy()
 
     def clear(self) -> None:
         """Clear all registered plugins and instances."""
         self._plugins.clear()
         self._instances.clear()
+        self._pending.clear()
         logger.info("registry_cleared", registry=self.__class__.__name__)
 
     def has_plugin(self, name: str) -> bool:
@@ -294,4 +442,4 @@ class PluginRegistry(ABC):
         Returns:
             True if registered
         """
-        return name in self._plugins
+        return name in self._plugins or name in self._pending
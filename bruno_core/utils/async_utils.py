@@ -5,6 +5,8 @@ Provides helpers for async/await operations.
 """
 
 import asyncio
+from concurrent.futures import Executor
+from functools import partial
 from typing import Any, Callable, Coroutine, List, Optional, TypeVar
 
 T = TypeVar("T")
@@ -52,6 +54,11 @@ async def gather_with_concurrency(
     Example:
         >>> results = await gather_with_concurrency(3, task1(), task2(), task3())
     """
+    # The limit can only bind when there are more tasks than slots; otherwise
+    # skip the semaphore and the per-task wrapper coroutines
+    if len(tasks) <= n:
+        return await asyncio.gather(*tasks)
+
     semaphore = asyncio.Semaphore(n)
 
     async def sem_task(task: Coroutine[Any, Any, T]) -> T:
@@ -67,6 +74,7 @@ async def retry_async(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
+    max_delay: Optional[float] = None,
     **kwargs: Any,
 ) -> T:
     """
@@ -78,6 +86,7 @@ async def retry_async(
         max_retries: Maximum number of retries
         delay: Initial delay between retries (seconds)
         backoff: Backoff multiplier
+        max_delay: Upper bound for the delay between retries (None for no limit)
         **kwargs: Function keyword arguments
 
     Returns:
@@ -88,9 +97,10 @@ async def retry_async(
 
     Example:
         >>> result = await retry_async(fetch_data, url="https://api.example.com")
+        >>> result = await retry_async(fetch_data, max_retries=8, max_delay=5.0)
     """
     last_exception = None
-    current_delay = delay
+    current_delay = delay if max_delay is None else min(delay, max_delay)
 
     for attempt in range(max_retries + 1):
         try:
@@ -100,6 +110,8 @@ async def retry_async(
             if attempt < max_retries:
                 await asyncio.sleep(current_delay)
                 current_delay *= backoff
+                if max_delay is not None and current_delay > max_delay:
+                    current_delay = max_delay
             else:
                 break
 
@@ -112,16 +124,23 @@ async def retry_async(
 async def run_in_executor(
     func: Callable[..., T],
     *args: Any,
+    executor: Optional[Executor] = None,
     **kwargs: Any,
 ) -> T:
     """
     Run a synchronous function in an executor.
 
     Useful for running blocking operations without blocking the event loop.
+    Pass a dedicated, bounded executor to keep slow calls (LLM clients,
+    database drivers) from queuing behind unrelated work in the loop's
+    shared default pool.
 
     Args:
         func: Synchronous function to run
         *args: Function arguments
+        executor: Executor to run in (default: the loop's default executor).
+            Consumed by this helper, so a target that takes its own
+            ``executor`` keyword must be wrapped with ``functools.partial``
         **kwargs: Function keyword arguments
 
     Returns:
@@ -129,9 +148,15 @@ async def run_in_executor(
 
     Example:
         >>> result = await run_in_executor(blocking_function, arg1, arg2)
+        >>> pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm")
+        >>> result = await run_in_executor(client.complete, prompt, executor=pool)
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+    loop = asyncio.get_running_loop()
+    # Hand the target and its arguments to the executor directly; only
+    # keyword arguments need binding, since run_in_executor takes none
+    if kwargs:
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+    return await loop.run_in_executor(executor, func, *args)
 
 
 async def cancel_tasks(*tasks: asyncio.Task[Any]) -> None:
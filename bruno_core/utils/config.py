@@ -7,7 +7,7 @@ Provides configuration loading, saving, and management.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Callable, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -15,6 +15,17 @@ from dotenv import load_dotenv
 from bruno_core.models.config import BrunoConfig
 from bruno_core.utils.exceptions import ConfigError
 
+# Config file readers by file suffix, and writers by format name
+_CONFIG_LOADERS: Dict[str, Callable[[IO[str]], Any]] = {
+    ".yaml": yaml.safe_load,
+    ".yml": yaml.safe_load,
+    ".json": json.load,
+}
+_CONFIG_SERIALIZERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "yaml": lambda data: yaml.safe_dump(data, default_flow_style=False, indent=2),
+    "json": lambda data: json.dumps(data, indent=2),
+}
+
 
 def load_config(
     config_path: Optional[str] = None,
@@ -55,14 +66,11 @@ def load_config(
             raise ConfigError(f"Configuration file not found: {config_path}")
 
         try:
-            if config_path.endswith((".yaml", ".yml")):
-                with open(config_path_obj, "r", encoding="utf-8") as f:
-                    config_dict = yaml.safe_load(f) or {}
-            elif config_path.endswith(".json"):
-                with open(config_path_obj, "r", encoding="utf-8") as f:
-                    config_dict = json.load(f)
-            else:
+            loader = _CONFIG_LOADERS.get(config_path_obj.suffix)
+            if loader is None:
                 raise ConfigError(f"Unsupported config file format: {config_path}")
+            with open(config_path_obj, "r", encoding="utf-8") as f:
+                config_dict = loader(f) or {}
         except Exception as e:
             raise ConfigError(
                 f"Failed to load configuration from {config_path}",
@@ -97,17 +105,16 @@ def save_config(config: BrunoConfig, config_path: str, format: str = "yaml") ->
     config_dict = config.model_dump(exclude_none=True)
 
     try:
+        # Serialize in memory first: one write call, and a serialization
+        # error never leaves a truncated file behind
+        serializer = _CONFIG_SERIALIZERS.get(format)
+        if serializer is None:
+            raise ConfigError(f"Unsupported format: {format}")
+        content = serializer(config_dict)
+
         config_path_obj = Path(config_path)
         config_path_obj.parent.mkdir(parents=True, exist_ok=True)
-
-        if format == "yaml":
-            with open(config_path_obj, "w", encoding="utf-8") as f:
-                yaml.safe_dump(config_dict, f, default_flow_style=False, indent=2)
-        elif format == "json":
-            with open(config_path_obj, "w", encoding="utf-8") as f:
-                json.dump(config_dict, f, indent=2)
-        else:
-            raise ConfigError(f"Unsupported format: {format}")
+        config_path_obj.write_text(content, encoding="utf-8")
     except Exception as e:
         raise ConfigError(f"Failed to save configuration to {config_path}", cause=e)
 
@@ -142,6 +149,23 @@ def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, A
     return result
 
 
+# (environment variable, config section or None for top level, key, converter)
+_ENV_OVERRIDES: Tuple[Tuple[str, Optional[str], str, Callable[[str], Any]], ...] = (
+    ("BRUNO_LLM_PROVIDER", "llm", "provider", str),
+    ("BRUNO_LLM_MODEL", "llm", "model", str),
+    ("BRUNO_LLM_API_KEY", "llm", "api_key", str),
+    ("BRUNO_LLM_BASE_URL", "llm", "base_url", str),
+    ("BRUNO_LLM_TEMPERATURE", "llm", "temperature", float),
+    ("BRUNO_LLM_MAX_TOKENS", "llm", "max_tokens", int),
+    ("BRUNO_MEMORY_BACKEND", "memory", "backend", str),
+    ("BRUNO_MEMORY_CONNECTION_STRING", "memory", "connection_string", str),
+    ("BRUNO_MEMORY_MAX_MESSAGES", "memory", "max_messages", int),
+    ("BRUNO_ASSISTANT_NAME", "assistant", "name", str),
+    ("BRUNO_ASSISTANT_LANGUAGE", "assistant", "language", str),
+    ("BRUNO_LOG_LEVEL", None, "log_level", str),
+)
+
+
 def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Apply environment variable overrides to configuration.
@@ -155,51 +179,17 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Configuration with environment overrides
     """
-    # LLM overrides
-    if "llm" not in config:
-        config["llm"] = {}
-
-    if os.getenv("BRUNO_LLM_PROVIDER"):
-        config["llm"]["provider"] = os.getenv("BRUNO_LLM_PROVIDER")
-    if os.getenv("BRUNO_LLM_MODEL"):
-        config["llm"]["model"] = os.getenv("BRUNO_LLM_MODEL")
-    if os.getenv("BRUNO_LLM_API_KEY"):
-        config["llm"]["api_key"] = os.getenv("BRUNO_LLM_API_KEY")
-    if os.getenv("BRUNO_LLM_BASE_URL"):
-        config["llm"]["base_url"] = os.getenv("BRUNO_LLM_BASE_URL")
-    if os.getenv("BRUNO_LLM_TEMPERATURE"):
-        temp_str = os.getenv("BRUNO_LLM_TEMPERATURE")
-        if temp_str:
-            config["llm"]["temperature"] = float(temp_str)
-    if os.getenv("BRUNO_LLM_MAX_TOKENS"):
-        max_tokens_str = os.getenv("BRUNO_LLM_MAX_TOKENS")
-        if max_tokens_str:
-            config["llm"]["max_tokens"] = int(max_tokens_str)
-
-    # Memory overrides
-    if "memory" not in config:
-        config["memory"] = {}
-
-    if os.getenv("BRUNO_MEMORY_BACKEND"):
-        config["memory"]["backend"] = os.getenv("BRUNO_MEMORY_BACKEND")
-    if os.getenv("BRUNO_MEMORY_CONNECTION_STRING"):
-        config["memory"]["connection_string"] = os.getenv("BRUNO_MEMORY_CONNECTION_STRING")
-    if os.getenv("BRUNO_MEMORY_MAX_MESSAGES"):
-        max_msgs_str = os.getenv("BRUNO_MEMORY_MAX_MESSAGES")
-        if max_msgs_str:
-            config["memory"]["max_messages"] = int(max_msgs_str)
-
-    # Assistant overrides
-    if "assistant" not in config:
-        config["assistant"] = {}
-
-    if os.getenv("BRUNO_ASSISTANT_NAME"):
-        config["assistant"]["name"] = os.getenv("BRUNO_ASSISTANT_NAME")
-    if os.getenv("BRUNO_ASSISTANT_LANGUAGE"):
-        config["assistant"]["language"] = os.getenv("BRUNO_ASSISTANT_LANGUAGE")
-
-    # Log level override
-    if os.getenv("BRUNO_LOG_LEVEL"):
-        config["log_level"] = os.getenv("BRUNO_LOG_LEVEL")
+    # Sections are always present, even without overrides
+    for section in ("llm", "memory", "assistant"):
+        if section not in config:
+            config[section] = {}
+
+    # One environment lookup per variable; empty values are ignored
+    for env_var, section, key, convert in _ENV_OVERRIDES:
+        value = os.environ.get(env_var)
+        if not value:
+            continue
+        target = config[section] if section else config
+        target[key] = convert(value)
 
     return config
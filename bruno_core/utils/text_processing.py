@@ -5,8 +5,45 @@ Provides text manipulation and processing helpers.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
+# Compiled once at import; these helpers run on every message
+_WORD_RE = re.compile(r"\b\w+\b")
+_SPACES_RE = re.compile(r" +")
+_NEWLINES_RE = re.compile(r"\n+")
+# One pass finds every "<number><unit>" pair (e.g. "1h", "30 M"); matching
+# both cases here saves lowercasing the whole input
+_DURATION_RE = re.compile(r"(\d+)\s*([hmsHMS])")
+_UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1, "H": 3600, "M": 60, "S": 1}
+
+# Words too common to be keywords; built once instead of on every call
+_COMMON_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+    }
+)
+
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """
@@ -49,10 +86,10 @@ def clean_whitespace(text: str) -> str:
         'Hello world\\ntest'
     """
     # Replace multiple spaces with single space
-    text = re.sub(r" +", " ", text)
+    text = _SPACES_RE.sub(" ", text)
 
     # Replace multiple newlines with single newline
-    text = re.sub(r"\n+", "\n", text)
+    text = _NEWLINES_RE.sub("\n", text)
 
     # Remove leading/trailing whitespace from each line
     lines = [line.strip() for line in text.split("\n")]
@@ -78,44 +115,16 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
         ['python', 'programming', 'language']
     """
     # Convert to lowercase and split into words
-    words = re.findall(r"\b\w+\b", text.lower())
-
-    # Filter by length and remove common words
-    common_words = {
-        "the",
-        "a",
-        "an",
-        "and",
-        "or",
-        "but",
-        "in",
-        "on",
-        "at",
-        "to",
-        "for",
-        "of",
-        "with",
-        "by",
-        "is",
-        "are",
-        "was",
-        "were",
-        "be",
-        "been",
-        "being",
-    }
+    words = _WORD_RE.findall(text.lower())
 
-    keywords = [word for word in words if len(word) >= min_length and word not in common_words]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-
-    return unique_keywords
+    # Filter by length and remove common words, then remove duplicates
+    # while preserving order; dict.fromkeys does the de-duplication in C
+    # instead of a Python-level seen-set loop
+    return list(
+        dict.fromkeys(
+            word for word in words if len(word) >= min_length and word not in _COMMON_WORDS
+        )
+    )
 
 
 def highlight_text(text: str, query: str, tag: str = "**") -> str:
@@ -152,7 +161,7 @@ def count_words(text: str) -> int:
         >>> count_words("Hello world")
         2
     """
-    return len(re.findall(r"\b\w+\b", text))
+    return len(_WORD_RE.findall(text))
 
 
 def count_tokens_estimate(text: str) -> int:
@@ -174,10 +183,14 @@ def count_tokens_estimate(text: str) -> int:
     return len(text) // 4
 
 
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """
     Format duration in seconds to human-readable string.
 
+    Results are memoized, since progress displays format the same values
+    repeatedly.
+
     Args:
         seconds: Duration in seconds
 
@@ -191,16 +204,14 @@ def format_duration(seconds: int) -> str:
     if seconds < 60:
         return f"{seconds}s"
 
-    minutes = seconds // 60
-    seconds = seconds % 60
+    minutes, seconds = divmod(seconds, 60)
 
     if minutes < 60:
         if seconds > 0:
             return f"{minutes}m {seconds}s"
         return f"{minutes}m"
 
-    hours = minutes // 60
-    minutes = minutes % 60
+    hours, minutes = divmod(minutes, 60)
 
     parts = [f"{hours}h"]
     if minutes > 0:
@@ -211,12 +222,16 @@ def format_duration(seconds: int) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=1024)
 def parse_duration(text: str) -> Optional[int]:
     """
     Parse duration string to seconds.
 
     Supports formats like: "5m", "1h 30m", "2h", "90s"
 
+    Results are memoized, since the same few phrases ("5m", "1h") recur
+    across requests.
+
     Args:
         text: Duration text to parse
 
@@ -227,22 +242,14 @@ def parse_duration(text: str) -> Optional[int]:
         >>> parse_duration("1h 30m")
         5400
     """
-    text = text.lower().strip()
     total_seconds = 0
 
-    # Extract hours
-    hours_match = re.search(r"(\d+)\s*h", text)
-    if hours_match:
-        total_seconds += int(hours_match.group(1)) * 3600
-
-    # Extract minutes
-    minutes_match = re.search(r"(\d+)\s*m", text)
-    if minutes_match:
-        total_seconds += int(minutes_match.group(1)) * 60
-
-    # Extract seconds
-    seconds_match = re.search(r"(\d+)\s*s", text)
-    if seconds_match:
-        total_seconds += int(seconds_match.group(1))
+    # The first value given for each unit counts, in either case
+    seen_units = set()
+    for match in _DURATION_RE.finditer(text):
+        unit_seconds = _UNIT_SECONDS[match.group(2)]
+        if unit_seconds not in seen_units:
+            seen_units.add(unit_seconds)
+            total_seconds += int(match.group(1)) * unit_seconds
 
     return total_seconds if total_seconds > 0 else None
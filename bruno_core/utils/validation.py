@@ -9,6 +9,10 @@ from typing import Any, Dict, List, Optional
 
 from bruno_core.utils.exceptions import ValidationError
 
+# Compiled once at import; these validators run on every user-supplied value
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+
 
 def validate_user_id(user_id: str) -> str:
     """
@@ -125,8 +129,7 @@ def validate_email(email: str) -> str:
     """
     email = email.strip().lower()
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError("Invalid email address", details={"email": email})
 
     return email
@@ -151,8 +154,7 @@ def validate_url(url: str) -> str:
     """
     url = url.strip()
 
-    pattern = r"^https?://[^\s/$.?#].[^\s]*$"
-    if not re.match(pattern, url, re.IGNORECASE):
+    if not _URL_RE.match(url):
         raise ValidationError("Invalid URL", details={"url": url})
 
     return url
@@ -0,0 +1,33 @@
+"""Tests for async utilities."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from bruno_core.utils.async_utils import retry_async
+
+
+@pytest.mark.asyncio
+class TestRetryAsync:
+    """Tests for retry_async."""
+
+    async def test_delays_back_off(self):
+        """Test delays grow by the backoff multiplier."""
+        func = AsyncMock(side_effect=[ValueError(), ValueError(), ValueError(), "ok"])
+
+        with patch("bruno_core.utils.async_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await retry_async(func, max_retries=3, delay=1.0, backoff=2.0)
+
+        assert result == "ok"
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 4.0]
+
+    async def test_max_delay_caps_every_delay(self):
+        """Test max_delay also bounds the first delay."""
+        func = AsyncMock(side_effect=ValueError("down"))
+
+        with patch("bruno_core.utils.async_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(ValueError, match="down"):
+                await retry_async(func, max_retries=3, delay=10.0, backoff=2.0, max_delay=5.0)
+
+        assert [c.args[0] for c in sleep.await_args_list] == [5.0, 5.0, 5.0]
+        assert func.await_count == 4
@@ -1,9 +1,13 @@
 """Tests for BaseAssistant."""
 
+import asyncio
+
 import pytest
 
 from bruno_core.base.assistant import BaseAssistant
+from bruno_core.models.ability import AbilityRequest
 from bruno_core.models.message import Message, MessageRole
+from bruno_core.utils.exceptions import BrunoError
 from tests.conftest import MockAbility, MockLLM, MockMemory
 
 
@@ -44,6 +48,146 @@ class TestBaseAssistant:
         assert response.success is True
         assert response.text == "Mock response"
 
+    async def test_store_overlaps_generation(self, mock_llm, mock_memory):
+        """Test the user message is stored while the response is generated."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        events = []
+        store_message = mock_memory.store_message
+        generate = mock_llm.generate
+
+        async def slow_store(message, conversation_id):
+            events.append(f"store_start:{message.role.value}")
+            await asyncio.sleep(0.01)
+            await store_message(message, conversation_id)
+            events.append(f"store_end:{message.role.value}")
+
+        async def slow_generate(messages, **kwargs):
+            events.append("generate_start")
+            await asyncio.sleep(0.01)
+            return await generate(messages, **kwargs)
+
+        mock_memory.store_message = slow_store
+        mock_llm.generate = slow_generate
+
+        message = Message(role=MessageRole.USER, content="Hello!")
+        await assistant.process_message(message, user_id="test-user", conversation_id="c")
+
+        assert events.index("generate_start") < events.index("store_end:user")
+        assert events[-2:] == ["store_start:assistant", "store_end:assistant"]
+
+        # With an ability detected, it runs only after the turn succeeds
+        ability = MockAbility(name="timer", actions=["execute"])
+        original = ability.execute_action
+
+        async def slow_action(request):
+            events.append("ability_start")
+            await asyncio.sleep(0.01)
+            return await original(request)
+
+        ability.execute_action = slow_action
+        await assistant.register_ability(ability)
+        events.clear()
+
+        message = Message(role=MessageRole.USER, content="Start a timer")
+        response = await assistant.process_message(
+            message, user_id="test-user", conversation_id="c"
+        )
+
+        assert [a.status.value for a in response.actions] == ["success"]
+        assert events.index("generate_start") < events.index("store_end:user")
+        assert events[-1] == "ability_start"
+
+    async def test_failed_generation_skips_abilities(self, mock_memory):
+        """Test a failed turn runs no abilities but still stores the user message."""
+        llm = MockLLM()
+
+        async def failing_generate(messages, **kwargs):
+            raise RuntimeError("llm down")
+
+        llm.generate = failing_generate
+        assistant = BaseAssistant(llm=llm, memory=mock_memory)
+        await assistant.initialize()
+
+        ability = MockAbility(name="timer", actions=["execute"])
+        await assistant.register_ability(ability)
+
+        store_message = mock_memory.store_message
+        stored = []
+
+        async def slow_store(message, conversation_id):
+            await asyncio.sleep(0.01)
+            await store_message(message, conversation_id)
+            stored.append(message.role.value)
+
+        mock_memory.store_message = slow_store
+
+        message = Message(role=MessageRole.USER, content="Start a timer")
+        with pytest.raises(BrunoError):
+            await assistant.process_message(message, user_id="test-user", conversation_id="c")
+
+        assert ability.executed_requests == []
+        assert stored == ["user"]
+
+    async def test_cancelled_turn_still_stores_user_message(self, mock_llm, mock_memory):
+        """Test cancelling a turn mid-generation does not drop the user message."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        store_message = mock_memory.store_message
+        stored = []
+
+        async def slow_store(message, conversation_id):
+            await asyncio.sleep(0.02)
+            await store_message(message, conversation_id)
+            stored.append(message.role.value)
+
+        async def slow_generate(messages, **kwargs):
+            await asyncio.sleep(1)
+            return "late"
+
+        mock_memory.store_message = slow_store
+        mock_llm.generate = slow_generate
+
+        message = Message(role=MessageRole.USER, content="Hello!")
+        task = asyncio.ensure_future(
+            assistant.process_message(message, user_id="test-user", conversation_id="c")
+        )
+        await asyncio.sleep(0.005)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert stored == ["user"]
+
+    async def test_failed_store_cancels_generation(self, mock_llm, mock_memory):
+        """Test a failed user-message store stops the pending generation."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        events = []
+
+        async def failing_store(message, conversation_id):
+            raise RuntimeError("memory down")
+
+        async def slow_generate(messages, **kwargs):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                events.append("generate_cancelled")
+                raise
+            return "late"
+
+        mock_memory.store_message = failing_store
+        mock_llm.generate = slow_generate
+
+        message = Message(role=MessageRole.USER, content="Hello!")
+        with pytest.raises(BrunoError):
+            await assistant.process_message(message, user_id="test-user", conversation_id="c")
+
+        assert events == ["generate_cancelled"]
+
     async def test_register_ability(self, mock_llm, mock_memory, mock_ability):
         """Test registering an ability."""
         assistant = BaseAssistant(
@@ -95,6 +239,101 @@ class TestBaseAssistant:
         assert response.success is True
         assert len(ability.executed_requests) > 0
 
+    async def test_detect_abilities(self, mock_llm, mock_memory):
+        """Test ability names are detected in registration order."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        for name in ("timer", "time", "notes"):
+            await assistant.register_ability(MockAbility(name=name))
+
+        context = await mock_memory.get_context("test-user", "test-conv")
+        message = Message(role=MessageRole.USER, content="Set a TIMER, then check notes")
+
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["timer", "time", "notes"]
+
+        await assistant.unregister_ability("notes")
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["timer", "time"]
+
+        # Abilities added to the dict directly are still picked up
+        assistant.abilities["notes"] = MockAbility(name="notes")
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["timer", "time", "notes"]
+
+        # Swapping one ability for another keeps the count but not the names
+        del assistant.abilities["notes"]
+        assistant.abilities["check"] = MockAbility(name="check")
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["timer", "time", "check"]
+
+    async def test_detect_abilities_ignores_name_case(self, mock_llm, mock_memory):
+        """Test mixed-case ability names match case-folded message content."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.register_ability(MockAbility(name="Weather"))
+        await assistant.register_ability(MockAbility(name="Straße"))
+
+        context = await mock_memory.get_context("test-user", "test-conv")
+        message = Message(role=MessageRole.USER, content="what's the weather like?")
+
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["Weather"]
+
+        message = Message(role=MessageRole.USER, content="Route via HAUPTSTRASSE")
+        requests = await assistant._detect_abilities(message, context)
+        assert [r.ability_name for r in requests] == ["Straße"]
+
+    async def test_execute_abilities_concurrently(self, mock_llm, mock_memory):
+        """Test different abilities overlap while one ability keeps request order."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        events = []
+        for name in ("timer", "notes"):
+            ability = MockAbility(name=name)
+            original = ability.execute_action
+
+            async def tracked(request, original=original):
+                events.append(f"start:{request.ability_name}:{request.parameters['n']}")
+                await asyncio.sleep(0.01)
+                events.append(f"end:{request.ability_name}:{request.parameters['n']}")
+                return await original(request)
+
+            ability.execute_action = tracked
+            await assistant.register_ability(ability)
+
+        requests = [
+            AbilityRequest(ability_name=name, action="test", parameters={"n": n}, user_id="u")
+            for name, n in (("timer", 1), ("notes", 2), ("timer", 3))
+        ]
+        results = await assistant._execute_abilities(requests)
+
+        assert [r.action_type for r in results] == ["timer", "notes", "timer"]
+        assert events.index("start:notes:2") < events.index("end:timer:1")
+        assert events.index("end:timer:1") < events.index("start:timer:3")
+
+    async def test_abilities_detected_after_initialize(self, mock_llm, mock_memory):
+        """Test abilities are detected from the first message and track registration."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.register_ability(MockAbility(name="timer"))
+        await assistant.initialize()
+
+        async def detected(content):
+            message = Message(role=MessageRole.USER, content=content)
+            response = await assistant.process_message(
+                message, user_id="test-user", conversation_id="c"
+            )
+            return [action.action_type for action in response.actions]
+
+        assert await detected("Start a timer") == ["timer"]
+
+        await assistant.register_ability(MockAbility(name="notes"))
+        assert await detected("Start a timer and take notes") == ["timer", "notes"]
+
+        await assistant.unregister_ability("timer")
+        assert await detected("Start a timer and take notes") == ["notes"]
+
     async def test_shutdown(self, mock_llm, mock_memory):
         """Test assistant shutdown."""
         assistant = BaseAssistant(
@@ -106,6 +345,54 @@ class TestBaseAssistant:
 
         assert assistant.initialized is False
 
+    async def test_shutdown_is_idempotent(self, mock_llm, mock_memory):
+        """Test repeated or concurrent shutdown calls shut each ability down once."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        ability = MockAbility(name="timer")
+        calls = []
+        original = ability.shutdown
+
+        async def counting_shutdown():
+            calls.append(1)
+            await asyncio.sleep(0)
+            await original()
+
+        ability.shutdown = counting_shutdown
+        await assistant.register_ability(ability)
+
+        await asyncio.gather(assistant.shutdown(), assistant.shutdown())
+        await assistant.shutdown()
+
+        assert calls == [1]
+        assert assistant.abilities == {}
+        assert assistant.initialized is False
+
+    async def test_shutdown_runs_abilities_concurrently(self, mock_llm, mock_memory):
+        """Test abilities shut down together and one failure does not stop the rest."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        events = []
+        for name in ("timer", "notes", "broken"):
+            ability = MockAbility(name=name)
+
+            async def tracked_shutdown(name=name):
+                events.append(f"start:{name}")
+                await asyncio.sleep(0.01)
+                if name == "broken":
+                    raise RuntimeError("stuck")
+                events.append(f"end:{name}")
+
+            ability.shutdown = tracked_shutdown
+            await assistant.register_ability(ability)
+
+        await assistant.shutdown()
+
+        assert events[:3] == ["start:timer", "start:notes", "start:broken"]
+        assert sorted(events[3:]) == ["end:notes", "end:timer"]
+
     async def test_health_check(self, mock_llm, mock_memory):
         """Test health check."""
         assistant = BaseAssistant(
@@ -118,6 +405,26 @@ class TestBaseAssistant:
         assert health["status"] == "healthy"
         assert health["abilities_count"] == 0
 
+    async def test_health_check_reports_ability_errors(self, mock_llm, mock_memory):
+        """Test a failing ability check is reported without hiding the others."""
+        assistant = BaseAssistant(llm=mock_llm, memory=mock_memory)
+        await assistant.initialize()
+
+        broken = MockAbility(name="broken")
+
+        async def failing_health_check():
+            raise RuntimeError("offline")
+
+        broken.health_check = failing_health_check
+        await assistant.register_ability(broken)
+        await assistant.register_ability(MockAbility(name="timer"))
+
+        health = await assistant.health_check()
+        assert health["llm"] == "connected"
+        assert health["abilities"]["broken"] == {"status": "error", "error": "offline"}
+        assert "timer" in health["abilities"]
+        assert health["abilities"]["timer"] != health["abilities"]["broken"]
+
     async def test_multiple_messages(self, mock_llm, mock_memory):
         """Test processing multiple messages."""
         assistant = BaseAssistant(
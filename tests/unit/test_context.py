@@ -1,11 +1,17 @@
 """Tests for context management."""
 
+import asyncio
+import gc
+import shutil
+import threading
+
 import pytest
 
 from bruno_core.context.manager import ContextManager
 from bruno_core.context.session import SessionManager
 from bruno_core.context.state import StateManager
 from bruno_core.models.message import Message, MessageRole
+from bruno_core.utils.exceptions import StateError
 from tests.conftest import MockMemory
 
 
@@ -43,6 +49,10 @@ class TestContextManager:
         # Should only keep last 3 messages
         assert manager.get_buffer_size("conv-123") == 3
 
+        context = await manager.get_context("conv-123")
+        assert [m.content for m in context.messages] == ["Message 2", "Message 3", "Message 4"]
+        assert manager.get_statistics()["total_buffered_messages"] == 3
+
     async def test_get_context(self):
         """Test getting conversation context."""
         memory = MockMemory()
@@ -92,6 +102,123 @@ class TestContextManager:
         assert stats["active_conversations"] == 1
         assert stats["total_buffered_messages"] == 1
 
+    async def test_statistics_track_window_and_clear(self):
+        """Test statistics stay consistent across trimming and clearing."""
+        memory = MockMemory()
+        manager = ContextManager(memory=memory, max_messages=2)
+
+        for conv in ("conv-1", "conv-2"):
+            for i in range(3):
+                message = Message(role=MessageRole.USER, content=f"Message {i}")
+                await manager.add_message(message=message, conversation_id=conv)
+
+        stats = manager.get_statistics()
+        assert stats["total_buffered_messages"] == 4
+        assert stats["total_messages_processed"] == 6
+
+        await manager.clear_context("conv-1")
+
+        stats = manager.get_statistics()
+        assert stats["total_buffered_messages"] == 2
+        assert stats["total_messages_processed"] == 3
+
+    async def test_window_size_changes(self):
+        """Test buffered counts stay exact for empty and resized windows."""
+        memory = MockMemory()
+        manager = ContextManager(memory=memory, max_messages=0)
+
+        for i in range(3):
+            message = Message(role=MessageRole.USER, content=f"Message {i}")
+            await manager.add_message(message=message, conversation_id="conv-1")
+
+        assert manager.get_buffer_size("conv-1") == 0
+        assert manager.get_statistics()["total_buffered_messages"] == 0
+
+        manager.max_messages = 3
+        for i in range(4):
+            message = Message(role=MessageRole.USER, content=f"Message {i}")
+            await manager.add_message(message=message, conversation_id="conv-1")
+
+        manager.max_messages = 2
+        await manager.add_message(Message(role=MessageRole.USER, content="last"), "conv-1")
+
+        context = await manager.get_context("conv-1")
+        assert [m.content for m in context.messages] == ["Message 3", "last"]
+        assert manager.get_statistics()["total_buffered_messages"] == 2
+
+    async def test_add_messages_batch(self):
+        """Test batch adds match adding messages one by one."""
+        memory = MockMemory()
+        manager = ContextManager(memory=memory, max_messages=3)
+
+        await manager.add_message(Message(role=MessageRole.USER, content="first"), "conv-1")
+        await manager.add_messages(
+            [Message(role=MessageRole.USER, content=f"Message {i}") for i in range(4)],
+            conversation_id="conv-1",
+            user_id="user-123",
+        )
+
+        context = await manager.get_context("conv-1")
+        assert [m.content for m in context.messages] == ["Message 1", "Message 2", "Message 3"]
+        assert manager.get_total_messages("conv-1") == 5
+
+        stats = manager.get_statistics()
+        assert stats["total_buffered_messages"] == 3
+        assert stats["total_messages_processed"] == 5
+        stored = [m.content for msgs in memory.messages.values() for m in msgs]
+        assert stored == [f"Message {i}" for i in range(4)]
+
+    async def test_get_last_message(self):
+        """Test the newest message of a role is found without building a context."""
+        manager = ContextManager(memory=MockMemory(), max_messages=10)
+        assert manager.get_last_message("conv-1") is None
+
+        await manager.add_messages(
+            [
+                Message(role=MessageRole.USER, content="question 1"),
+                Message(role=MessageRole.ASSISTANT, content="answer 1"),
+                Message(role=MessageRole.USER, content="question 2"),
+            ],
+            conversation_id="conv-1",
+        )
+
+        assert manager.get_last_message("conv-1").content == "answer 1"
+        assert manager.get_last_message("conv-1", MessageRole.USER).content == "question 2"
+        assert manager.get_last_message("conv-1", MessageRole.SYSTEM) is None
+
+    async def test_background_save(self):
+        """Test background saves do not block adding and keep message order."""
+        memory = MockMemory()
+        store_message = memory.store_message
+        release = asyncio.Event()
+
+        async def slow_store(message, conversation_id):
+            await release.wait()
+            if message.content == "broken":
+                raise RuntimeError("backend down")
+            await store_message(message, conversation_id)
+
+        memory.store_message = slow_store
+        manager = ContextManager(memory=memory, background_save=True)
+
+        await manager.add_message(Message(role=MessageRole.USER, content="first"), "c", "u")
+        await manager.add_message(Message(role=MessageRole.USER, content="broken"), "c", "u")
+        await manager.add_messages(
+            [Message(role=MessageRole.ASSISTANT, content=f"reply {i}") for i in range(2)],
+            conversation_id="c",
+            user_id="u",
+        )
+
+        # Messages are in the window before anything reached memory
+        assert manager.get_buffer_size("c") == 4
+        assert memory.messages == {}
+
+        release.set()
+        await manager.flush()
+
+        stored = [m.content for msgs in memory.messages.values() for m in msgs]
+        assert stored == ["first", "reply 0", "reply 1"]
+
 
 @pytest.mark.asyncio
 class TestSessionManager:
@@ -151,6 +278,18 @@ class TestSessionManager:
         active = manager.list_active_sessions()
         assert len(active) == 2
 
+    async def test_list_active_sessions_by_user(self):
+        """Test filtering active sessions by user."""
+        manager = SessionManager()
+
+        first = await manager.start_session(user_id="user-1")
+        second = await manager.start_session(user_id="user-1")
+        await manager.start_session(user_id="user-2")
+        await manager.end_session(first.session_id)
+
+        assert manager.list_active_sessions(user_id="user-1") == [second.session_id]
+        assert manager.list_active_sessions(user_id="user-3") == []
+
     async def test_session_statistics(self):
         """Test session statistics."""
         manager = SessionManager()
@@ -160,6 +299,49 @@ class TestSessionManager:
         stats = manager.get_statistics()
         assert stats["active_sessions"] == 1
 
+    async def test_cleanup_expired_sessions(self):
+        """Test cleanup removes only sessions past their deadline."""
+        manager = SessionManager(session_timeout_seconds=0)
+
+        await manager.start_session(user_id="user-1")
+        await manager.start_session(user_id="user-2")
+        await asyncio.sleep(0.01)
+
+        assert await manager.cleanup_expired_sessions() == 2
+        assert manager.list_active_sessions() == []
+
+        manager = SessionManager(session_timeout_seconds=3600)
+        session = await manager.start_session(user_id="user-1")
+        await manager.update_session(session.session_id, active=True)
+
+        assert await manager.cleanup_expired_sessions() == 0
+        assert manager.list_active_sessions() == [session.session_id]
+
+    async def test_next_expiry_delay(self):
+        """Test the delay until the next session deadline."""
+        manager = SessionManager(session_timeout_seconds=60)
+        assert manager.get_next_expiry_delay() is None
+
+        session = await manager.start_session(user_id="user-1")
+        assert 0 < manager.get_next_expiry_delay() <= 60
+
+        await manager.end_session(session.session_id)
+        assert manager.get_next_expiry_delay() is None
+
+    async def test_session_activity_extends_deadline(self):
+        """Test repeated activity keeps moving the expiry deadline forward."""
+        manager = SessionManager(session_timeout_seconds=0.2)
+        session = await manager.start_session(user_id="user-1")
+
+        for _ in range(3):
+            await asyncio.sleep(0.05)
+            await manager.update_session(session.session_id)
+            assert await manager.cleanup_expired_sessions() == 0
+            assert 0.15 < manager.get_next_expiry_delay() <= 0.2
+
+        await asyncio.sleep(0.25)
+        assert await manager.cleanup_expired_sessions() == 1
+
 
 @pytest.mark.asyncio
 class TestStateManager:
@@ -216,3 +398,192 @@ class TestStateManager:
 
         keys = await manager.list_keys("user-123")
         assert len(keys) == 0
+
+    async def test_file_state_survives_namespace_clear(self, tmp_path):
+        """Test file-based writes recreate a namespace after it is cleared."""
+        manager = StateManager(storage_path=str(tmp_path))
+
+        await manager.set_state("user-123", "key1", {"a": 1})
+        await manager.clear_namespace("user-123")
+        await manager.set_state("user-123", "key1", {"a": 2})
+
+        value = await manager.get_state("user-123", "key1")
+        assert value == {"a": 2}
+
+    async def test_file_state_survives_directory_removal(self, tmp_path):
+        """Test writes recreate a namespace directory removed by someone else."""
+        manager = StateManager(storage_path=str(tmp_path))
+
+        await manager.set_state("user-123", "key1", {"a": 1})
+        shutil.rmtree(tmp_path / "user-123")
+        await manager.set_state("user-123", "key1", {"a": 2})
+
+        assert await manager.get_state("user-123", "key1") == {"a": 2}
+
+    async def test_file_state_compact_json(self, tmp_path):
+        """Test state files are compact by default and indented on request."""
+        manager = StateManager(storage_path=str(tmp_path))
+        await manager.set_state("user-123", "prefs", {"theme": "dark"})
+
+        raw = (tmp_path / "user-123" / "prefs.json").read_text(encoding="utf-8")
+        assert raw == '{"theme": "dark"}'
+        assert await manager.get_state("user-123", "prefs") == {"theme": "dark"}
+
+        pretty = StateManager(storage_path=str(tmp_path / "pretty"), json_indent=2)
+        await pretty.set_state("user-123", "prefs", {"theme": "dark"})
+
+        raw = (tmp_path / "pretty" / "user-123" / "prefs.json").read_text(encoding="utf-8")
+        assert raw == '{\n  "theme": "dark"\n}'
+
+    async def test_file_state_concurrent_threads(self, tmp_path):
+        """Test concurrent writers from several threads do not collide."""
+        manager = StateManager(storage_path=str(tmp_path))
+
+        def write(i):
+            asyncio.run(manager.set_state("user-123", "shared", {"writer": i}))
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        value = await manager.get_state("user-123", "shared")
+        assert value["writer"] in range(8)
+        assert not list((tmp_path / "user-123").glob("*.tmp"))
+
+    async def test_file_state_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test a write that cannot replace the state file cleans up after itself."""
+        manager = StateManager(storage_path=str(tmp_path))
+        (tmp_path / "user-123" / "blocked.json").mkdir(parents=True)
+
+        with pytest.raises(StateError):
+            await manager.set_state("user-123", "blocked", {"a": 1})
+
+        assert not list((tmp_path / "user-123").glob("*.tmp"))
+
+    async def test_set_states_batch(self, tmp_path):
+        """Test setting several keys at once."""
+        for manager in (StateManager(use_memory=True), StateManager(storage_path=str(tmp_path))):
+            await manager.set_states("user-123", {"a": 1, "b": [2, 3]})
+
+            assert await manager.get_state("user-123", "a") == 1
+            assert await manager.get_state("user-123", "b") == [2, 3]
+            assert sorted(await manager.list_keys("user-123")) == ["a", "b"]
+
+    async def test_file_state_read_cache_invalidation(self, tmp_path):
+        """Test cached reads are refreshed after writes and deletes."""
+        manager = StateManager(storage_path=str(tmp_path), cache_size=1)
+
+        await manager.set_state("user-123", "a", {"v": 1})
+        await manager.set_state("user-123", "b", {"v": 1})
+        assert await manager.get_state("user-123", "a") == {"v": 1}
+
+        value = await manager.get_state("user-123", "a")
+        value["v"] = 99
+        assert await manager.get_state("user-123", "a") == {"v": 1}
+
+        await manager.set_state("user-123", "a", {"v": 2})
+        assert await manager.get_state("user-123", "a") == {"v": 2}
+        assert await manager.get_state("user-123", "b") == {"v": 1}
+
+        await manager.delete_state("user-123", "a")
+        assert await manager.get_state("user-123", "a") is None
+
+    async def test_file_state_missing_key(self, tmp_path):
+        """Test reading and deleting a missing file-based key."""
+        manager = StateManager(storage_path=str(tmp_path))
+
+        assert await manager.get_state("user-123", "missing", default=0) == 0
+        assert await manager.delete_state("user-123", "missing") is False
+
+        await manager.set_state("user-123", "present", 1)
+        assert await manager.delete_state("user-123", "present") is True
+
+    async def test_delete_states_batch(self, tmp_path):
+        """Test deleting several keys at once."""
+        for manager in (StateManager(use_memory=True), StateManager(storage_path=str(tmp_path))):
+            await manager.set_states("user-123", {"a": 1, "b": 2, "c": 3})
+
+            deleted = await manager.delete_states("user-123", ["a", "b", "missing"])
+
+            assert deleted == 2
+            assert await manager.list_keys("user-123") == ["c"]
+
+    async def test_file_state_rewrites_identical_value(self, tmp_path):
+        """Test writing a value again wins over another manager's write."""
+        first = StateManager(storage_path=str(tmp_path))
+        second = StateManager(storage_path=str(tmp_path))
+
+        await first.set_state("user-123", "prefs", {"v": 1})
+        await second.set_state("user-123", "prefs", {"v": 2})
+        await first.set_state("user-123", "prefs", {"v": 1})
+
+        assert await second.get_state("user-123", "prefs") == {"v": 1}
+
+    async def test_file_state_io_modes(self, tmp_path):
+        """Test file-based state with and without the I/O worker thread."""
+        offloaded = StateManager(storage_path=str(tmp_path / "offloaded"))
+        inline = StateManager(storage_path=str(tmp_path / "inline"), offload_io=False)
+
+        for manager in (offloaded, inline):
+            await manager.set_state("user-123", "key", [1, 2])
+            assert await manager.get_state("user-123", "key") == [1, 2]
+            assert await manager.list_namespaces() == ["user-123"]
+
+        offloaded.close()
+        assert await offloaded.get_state("user-123", "key") == [1, 2]
+        offloaded.close()
+
+    async def test_file_state_worker_lifecycle(self, tmp_path):
+        """Test the I/O worker starts on first use and is released afterwards."""
+
+        def io_threads():
+            return {t for t in threading.enumerate() if t.name.startswith("bruno-state-io")}
+
+        existing = io_threads()
+        async with StateManager(storage_path=str(tmp_path)) as manager:
+            assert io_threads() - existing == set()
+            await manager.set_state("user-123", "key", 1)
+            (worker,) = io_threads() - existing
+        assert not worker.is_alive()
+
+        dropped = StateManager(storage_path=str(tmp_path))
+        assert await dropped.get_state("user-123", "key") == 1
+        (worker,) = io_threads() - existing
+        del dropped
+        gc.collect()
+        worker.join(timeout=1)
+        assert not worker.is_alive()
+
+    async def test_file_clear_namespace_keeps_foreign_files(self, tmp_path):
+        """Test clearing a namespace only removes state files."""
+        manager = StateManager(storage_path=str(tmp_path))
+
+        assert await manager.clear_namespace("missing") == 0
+        assert await manager.list_keys("missing") == []
+
+        await manager.set_states("user-123", {"a": 1, "b": 2})
+        (tmp_path / "user-123" / "notes.txt").write_text("keep", encoding="utf-8")
+
+        assert await manager.clear_namespace("user-123") == 2
+        assert (tmp_path / "user-123" / "notes.txt").exists()
+
+        (tmp_path / "user-123" / "notes.txt").unlink()
+        await manager.set_state("user-123", "c", 3)
+        assert await manager.clear_namespace("user-123") == 1
+        assert not (tmp_path / "user-123").exists()
+
+    async def test_file_statistics_and_namespaces(self, tmp_path):
+        """Test file-based statistics count only namespace dirs and state files."""
+        manager = StateManager(storage_path=str(tmp_path / "state"))
+
+        await manager.set_states("user-1", {"a": 1, "b": 2})
+        await manager.set_state("user-2", "c", 3)
+        (tmp_path / "state" / "README.txt").write_text("not a namespace", encoding="utf-8")
+        (tmp_path / "state" / "user-2" / "notes.txt").write_text("x", encoding="utf-8")
+
+        stats = manager.get_statistics()
+        assert stats["namespaces"] == 2
+        assert stats["total_keys"] == 3
+        assert sorted(await manager.list_namespaces()) == ["user-1", "user-2"]
@@ -100,6 +100,30 @@ class TestEventBus:
         # Should only be called once (before unsubscribe)
         assert call_count == 1
 
+    async def test_subscription_changes_between_publishes(self):
+        """Test handlers added after a publish receive later events."""
+        bus = EventBus()
+        calls = []
+
+        def early(event):
+            calls.append("early")
+            # Subscribing mid-dispatch only affects later events
+            bus.subscribe(EventType.MESSAGE_RECEIVED, late, priority=10)
+
+        def late(event):
+            calls.append("late")
+
+        bus.subscribe(EventType.MESSAGE_RECEIVED, early)
+        event = Event(event_type=EventType.MESSAGE_RECEIVED)
+
+        await bus.publish(event)
+        assert calls == ["early"]
+
+        bus.subscribe_all(lambda e: calls.append("wildcard"))
+        bus.unsubscribe(EventType.MESSAGE_RECEIVED, early)
+        await bus.publish(event)
+        assert calls == ["early", "late", "wildcard"]
+
     async def test_event_history(self):
         """Test event history tracking."""
         bus = EventBus(enable_history=True, max_history=5)
@@ -113,6 +137,37 @@ class TestEventBus:
         # Should only keep last 5
         assert len(history) == 5
 
+    async def test_event_history_filter_and_limit(self):
+        """Test history filtering returns the most recent matches first."""
+        bus = EventBus(enable_history=True)
+
+        events = [
+            Event(event_type=EventType.MESSAGE_RECEIVED if i % 2 else EventType.SESSION_STARTED)
+            for i in range(6)
+        ]
+        await bus.publish_many(events)
+
+        history = bus.get_history(event_type=EventType.MESSAGE_RECEIVED, limit=2)
+
+        assert [e.event_id for e in history] == [events[5].event_id, events[3].event_id]
+
+    async def test_publish_many(self):
+        """Test batch publishing keeps order, history and statistics."""
+        bus = EventBus(enable_history=True, max_history=3)
+        received = []
+
+        def handler(event):
+            received.append(event.event_id)
+
+        bus.subscribe(EventType.MESSAGE_RECEIVED, handler)
+
+        events = [Event(event_type=EventType.MESSAGE_RECEIVED) for _ in range(5)]
+        await bus.publish_many(events)
+
+        assert received == [e.event_id for e in events]
+        assert [e.event_id for e in bus.get_history()] == [e.event_id for e in events[:1:-1]]
+        assert bus.get_statistics()["published"] == 5
+
     async def test_handler_priority(self):
         """Test handler priority."""
         bus = EventBus()
@@ -124,14 +179,18 @@ class TestEventBus:
         async def high_priority(event):
             execution_order.append("high")
 
+        async def also_low_priority(event):
+            execution_order.append("also-low")
+
         bus.subscribe(EventType.MESSAGE_RECEIVED, low_priority, priority=1)
         bus.subscribe(EventType.MESSAGE_RECEIVED, high_priority, priority=10)
+        bus.subscribe(EventType.MESSAGE_RECEIVED, also_low_priority, priority=1)
 
         event = Event(event_type=EventType.MESSAGE_RECEIVED)
         await bus.publish(event)
 
-        # High priority should execute first
-        assert execution_order == ["high", "low"]
+        # High priority should execute first; equal priorities keep subscription order
+        assert execution_order == ["high", "low", "also-low"]
 
     async def test_get_statistics(self):
         """Test event bus statistics."""
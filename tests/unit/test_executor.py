@@ -1,5 +1,7 @@
 """Tests for ActionExecutor."""
 
+import asyncio
+
 import pytest
 
 from bruno_core.base.executor import ActionExecutor
@@ -82,6 +84,43 @@ class TestActionExecutor:
         assert len(results) == 5
         assert all(r.status == ActionStatus.SUCCESS for r in results)
 
+    async def test_parallel_respects_concurrency_limit(self):
+        """Test parallel execution never exceeds max_concurrent abilities."""
+        executor = ActionExecutor(max_concurrent=2)
+        ability = MockAbility()
+        await ability.initialize()
+
+        running = 0
+        peak = 0
+        original = ability.execute_action
+
+        async def tracked(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await original(request)
+
+        ability.execute_action = tracked
+
+        actions = [
+            AbilityRequest(ability_name="mock", action="test", parameters={}, user_id="test-user")
+            for _ in range(6)
+        ]
+        results = await executor.execute(actions, {"mock": ability}, parallel=True)
+
+        assert len(results) == 6
+        assert peak == 2
+
+        # A limit of 0 runs every action at once
+        executor.max_concurrent = 0
+        peak = 0
+        results = await executor.execute(actions, {"mock": ability}, parallel=True)
+
+        assert len(results) == 6
+        assert peak == 6
+
     async def test_ability_not_found(self):
         """Test handling missing ability."""
         executor = ActionExecutor()
@@ -102,6 +141,32 @@ class TestActionExecutor:
         assert results[0].status == ActionStatus.FAILED
         assert "not found" in results[0].error.lower()
 
+    async def test_rollback_reverses_successful_actions(self):
+        """Test a failure rolls back earlier successes, newest first."""
+        executor = ActionExecutor()
+        ability = MockAbility()
+        await ability.initialize()
+
+        rolled_back = []
+
+        async def rollback(request):
+            rolled_back.append(request.action)
+
+        ability.rollback = rollback
+
+        actions = [
+            AbilityRequest(ability_name="mock", action=name, parameters={}, user_id="u")
+            for name in ("first", "second")
+        ]
+        actions.append(
+            AbilityRequest(ability_name="missing", action="third", parameters={}, user_id="u")
+        )
+
+        results = await executor.execute(actions, {"mock": ability})
+
+        assert [r.status for r in results][-1] == ActionStatus.FAILED
+        assert rolled_back == ["second", "first"]
+
     async def test_get_statistics(self):
         """Test execution statistics."""
         executor = ActionExecutor()
@@ -146,3 +211,10 @@ class TestActionExecutor:
         executor.clear_history()
         stats = executor.get_statistics()
         assert stats["total_executions"] == 0
+
+        # Totals restart from zero after clearing
+        await executor.execute(actions + actions, ability_map)
+        stats = executor.get_statistics()
+        assert stats["total_actions"] == 2
+        assert stats["successful"] == 2
+        assert stats["success_rate"] == 1.0
@@ -98,6 +98,29 @@ class TestConversationContext:
         assert len(llm_messages) == 2
         assert llm_messages[0]["role"] == "system"
 
+    def test_rolling_window_keeps_system_messages(self):
+        """Test trimming keeps system messages and the newest others."""
+        from bruno_core.models.context import SessionContext, UserContext
+
+        ctx = ConversationContext(
+            user=UserContext(user_id="test-user"),
+            session=SessionContext(user_id="test-user"),
+            max_messages=3,
+        )
+
+        ctx.add_message(Message(role=MessageRole.SYSTEM, content="System"))
+        for i in range(3):
+            ctx.add_message(Message(role=MessageRole.USER, content=f"Q{i}"))
+            ctx.add_message(Message(role=MessageRole.ASSISTANT, content=f"A{i}"))
+
+        assert [m.content for m in ctx.messages] == ["System", "Q2", "A2"]
+        assert ctx.get_last_user_message().content == "Q2"
+        assert ctx.get_last_assistant_message().content == "A2"
+
+        ctx.clear_messages()
+        assert [m.content for m in ctx.messages] == ["System"]
+        assert ctx.get_last_user_message() is None
+
 
 class TestAssistantResponse:
     """Tests for AssistantResponse model."""
@@ -168,6 +191,30 @@ class TestAbilityModels:
 
         assert param.param_type == AbilityParameterType.STRING
 
+    def test_parameter_value_types(self):
+        """Test values are checked against the parameter type and constraints."""
+        count = AbilityParameter(
+            name="count",
+            param_type=AbilityParameterType.INTEGER,
+            description="Number of items",
+            constraints={"min": 1, "max": 10},
+        )
+        ratio = AbilityParameter(
+            name="ratio", param_type=AbilityParameterType.FLOAT, description="Ratio"
+        )
+        anything = AbilityParameter(
+            name="value", param_type=AbilityParameterType.ANY, description="Anything"
+        )
+
+        assert count.validate_value(5) is True
+        assert count.validate_value("5") is False
+        assert count.validate_value(0) is False
+        assert count.validate_value(11) is False
+        assert ratio.validate_value(1) is True
+        assert ratio.validate_value(0.5) is True
+        assert ratio.validate_value([0.5]) is False
+        assert anything.validate_value(object()) is True
+
     def test_ability_request(self):
         """Test ability request."""
         request = AbilityRequest(
@@ -2,6 +2,7 @@
 
 import pytest
 
+from bruno_core.registry import base as registry_base
 from bruno_core.registry.ability_registry import AbilityRegistry
 from bruno_core.registry.llm_registry import LLMProviderRegistry
 from bruno_core.registry.memory_registry import MemoryBackendRegistry
@@ -33,6 +34,49 @@ class TestAbilityRegistry:
         assert isinstance(instance, MockAbility)
         assert instance.name == "mock"  # Default name
 
+    def test_discovery_reuses_entry_point_scan(self, monkeypatch):
+        """Test plugin discovery shares one recent entry point scan."""
+        calls = []
+        real_entry_points = registry_base.importlib.metadata.entry_points
+
+        def counting_entry_points():
+            calls.append(1)
+            return real_entry_points()
+
+        monkeypatch.setattr(registry_base, "_entry_points_cache", None)
+        monkeypatch.setattr(registry_base.importlib.metadata, "entry_points", counting_entry_points)
+
+        AbilityRegistry().discover_plugins()
+        LLMProviderRegistry().discover_plugins()
+
+        assert len(calls) == 1
+
+    def test_discovered_plugins_load_on_first_use(self, monkeypatch):
+        """Test discovered plugins are only imported when requested."""
+        loads = []
+
+        class FakeEntryPoint:
+            name = "lazy-ability"
+            group = "bruno.abilities"
+
+            def load(self):
+                loads.append(self.name)
+                return MockAbility
+
+        monkeypatch.setattr(registry_base, "_get_entry_points", lambda: [FakeEntryPoint()])
+
+        registry = AbilityRegistry()
+        registry.discover_plugins()
+
+        assert registry.has_plugin("lazy-ability")
+        assert registry.list_plugins() == ["lazy-ability"]
+        assert loads == []
+
+        instance = registry.get_instance("lazy-ability")
+        assert isinstance(instance, MockAbility)
+        assert registry.get("lazy-ability").entry_point == "lazy-ability"
+        assert loads == ["lazy-ability"]
+
     def test_unregister_ability(self):
         """Test unregistering ability."""
         registry = AbilityRegistry()
@@ -90,6 +134,35 @@ class TestLLMProviderRegistry:
         instance = registry.get_instance("mock")
         assert isinstance(instance, MockLLM)
 
+    def test_get_instance_with_arguments_is_fresh(self):
+        """Test instances built with constructor arguments are never shared."""
+        registry = LLMProviderRegistry()
+        registry.register("mock", MockLLM)
+
+        assert registry.get_instance("mock") is registry.get_instance("mock")
+        assert registry.get_instance("mock", responses=("a",)) is not registry.get_instance(
+            "mock", responses=("a",)
+        )
+
+    def test_get_shared_instance_shares_per_arguments(self):
+        """Test shared instances are reused for identical constructor arguments."""
+        registry = LLMProviderRegistry()
+        registry.register("mock", MockLLM)
+
+        first = registry.get_shared_instance("mock", responses=("a",))
+        assert registry.get_shared_instance("mock", responses=("a",)) is first
+        assert registry.get_shared_instance("mock", responses=("b",)) is not first
+        assert registry.get_instance("mock", responses=("a",)) is not first
+
+        # Unhashable arguments cannot key a shared instance
+        assert registry.get_shared_instance(
+            "mock", responses=["a"]
+        ) is not registry.get_shared_instance("mock", responses=["a"])
+
+        registry.unregister("mock")
+        registry.register("mock", MockLLM)
+        assert registry.get_shared_instance("mock", responses=("a",)) is not first
+
     def test_validate_llm_plugin(self):
         """Test LLM plugin validation."""
         registry = LLMProviderRegistry()